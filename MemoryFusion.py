@@ -5,14 +5,27 @@
 # Supports multi-cycle reflections with memory priority scoring
 # -------------------------------------------------------
 
+import atexit
 import json
+import time
 from statistics import mean
 from typing import Dict, Any, List
 
+try:
+    import orjson  # optional C encoder
+except ImportError:
+    orjson = None
+
+
+SAVE_EVERY = 8     # pending changes before the memory file is rewritten
+SAVE_AFTER = 2.0   # ...or seconds since the last write, whichever comes first
+
 
 class MemoryFusion:
     def __init__(self, memory_file: str = "long_term_memory.json"):
         self.memory_file = memory_file
+        self._unsaved = 0
+        self._last_save = time.monotonic()
         self.long_term_memory: Dict[str, Any] = {
             "thoughts": {},
             "reflections": [],
@@ -24,13 +37,15 @@ class MemoryFusion:
             },
         }
         self._load()
+        self._reflections = self.long_term_memory.setdefault("reflections", [])
+        atexit.register(self.flush)
 
     # ====================================================
     # CORE OPS
     # ====================================================
     def _load(self):
         try:
-            with open(self.memory_file, "r") as f:
+            with open(self.memory_file, "rb") as f:
                 data = json.load(f)
             if isinstance(data, dict):
                 self.long_term_memory.update(data)
@@ -39,11 +54,32 @@ class MemoryFusion:
                 meta.setdefault("reinforcement_log", [])
                 meta.setdefault("weighted_insights", {})
         except (FileNotFoundError, json.JSONDecodeError):
-            self._save()
+            self.save()
 
     def _save(self):
-        with open(self.memory_file, "w") as f:
-            json.dump(self.long_term_memory, f, indent=4)
+        """Note a change; the file is only rewritten every few changes or seconds."""
+        self._unsaved += 1
+        if self._unsaved >= SAVE_EVERY or time.monotonic() - self._last_save >= SAVE_AFTER:
+            self.save()
+
+    def save(self):
+        """Write the whole memory to disk now."""
+        if orjson is not None:
+            # orjson only indents by 2; the file stays valid, readable JSON.
+            data = orjson.dumps(
+                self.long_term_memory, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            data = json.dumps(self.long_term_memory, indent=4).encode("utf-8")
+        with open(self.memory_file, "wb") as f:
+            f.write(data)
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+
+    def flush(self):
+        """Write any changes still pending from _save()."""
+        if self._unsaved:
+            self.save()
 
     # ====================================================
     # TREND + REINFORCEMENT
@@ -69,11 +105,10 @@ class MemoryFusion:
 
     def _reinforce_reflection(self, conf_value: int):
         """Log and weight reinforced reflections."""
-        reflections = self.long_term_memory.get("reflections", [])
-        if not reflections:
+        if not self._reflections:
             return
 
-        latest = reflections[-1]
+        latest = self._reflections[-1]
         text = latest.get("reflection", "Unknown reflection")
 
         # Log reinforcement entry
@@ -3,17 +3,34 @@
 # Version: 8.8 | Priority Decay + Duplicate Task Merge
 # Keeps 8.7 features: Smart Auto-Export (MD/CSV/JSON), Autoloop, Drift
 # ------------------------------------------------------------
-import json, os, argparse, time, csv, re
+import json, os, argparse, time, csv, re, functools, heapq, math, sys
+from collections import deque
+from itertools import islice
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson   # optional: much faster (de)serialization of the memory file
+except ImportError:
+    orjson = None
+
 VERSION = "8.8"
-SCHEMA_VERSION = 11   # migration-safe
+SCHEMA_VERSION = 12   # migration-safe
 
 DATA_DIR = "data"
 REPORT_DIR = os.path.join(DATA_DIR, "reports")
 MEMORY_PATH = os.path.join(DATA_DIR, "long_term_memory.json")
-SESSION_LOG = os.path.join(DATA_DIR, "session_log.json")
+SESSION_LOG = os.path.join(DATA_DIR, "session_log.jsonl")
+LEGACY_SESSION_LOG = os.path.join(DATA_DIR, "session_log.json")   # pre-JSONL list; converted once
+SESSION_LOG_KEEP = 500
+SESSION_LOG_MAX_BYTES = 1_000_000
+
+HOT_KEEP = 50           # reflections/insights kept in the memory file; older ones live in the archive
+CONTEXT_CAP = 5
+EMOTION_CAP = 12
+SUMMARY_BUDGET = 200
+SUMMARY_DECAY = 0.05   # per summary; priority = weight * exp(-decay * age)
+SUMMARY_WEIGHTS = {"motivated": 1.0, "reflective": 0.8, "curious": 0.7, "neutral": 0.5}
 
 # ---------- Utilities ----------
 def _ensure_dirs():
@@ -26,29 +43,50 @@ def iso_now() -> str:
 def _short_ts() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
 
+def _tail(seq, n: int) -> list:
+    """Last n items of a list or deque (deques can't be sliced)."""
+    if isinstance(seq, deque):
+        return list(islice(reversed(seq), n))[::-1]
+    return seq[-n:]
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 def _read_json(path: str, default: Any) -> Any:
     try:
         if not os.path.isfile(path): return default
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return default
 
-def _write_json(path: str, data: Any) -> None:
+def _write_json(path: str, data: Any, atomic: bool = True) -> None:
+    """atomic=True: tmp + fsync + replace (memory). atomic=False: plain write (reports)."""
+    payload = _dumps(data)
+    if not atomic:
+        with open(path, "wb") as f:
+            f.write(payload)
+        return
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp, path)
 
 # ---------- Normalizers ----------
 _punct_re = re.compile(r"[\s\.\,\;\:\-\_\(\)\[\]\{\}\!\?\|/\\]+")
+@functools.lru_cache(maxsize=4096)   # task strings repeat every cycle
 def normalize_task(text: str) -> str:
     t = (text or "").lower().strip()
     t = _punct_re.sub(" ", t)
     t = re.sub(r"\s+", " ", t)
     # collapse leading verbs that often vary
     t = re.sub(r"^(define|list|do|make|create)\s+", "", t)
-    return t.strip()
+    return sys.intern(t.strip())
 
 # ---------- Memory ----------
 class Memory:
@@ -56,9 +94,24 @@ class Memory:
         self.path = path
         _ensure_dirs()
         self.data: Dict[str, Any] = {}
+        self._norm_index: Dict[str, str] = {}   # normalized key -> open task
+        self._dupes_dirty = False                 # merge pass needed on next maintenance
+        self._weights_sum = 0.0                   # running aggregate of insight_weights
+        self._weights_count = 0
+        self._heap: List[Tuple[float, int, str]] = []   # (-score, seq, task), lazily pruned
+        self._open_seq: Dict[str, int] = {}              # open task -> seq of its live heap entry (also the O(1) open set)
+        self._next_seq = 0
+        self._floored_at: float | None = None   # set while all non-top scores sit at this floor
+        self._summary_heap: List[Tuple[float, int, str]] = []   # (log-priority, seq, summary)
+        self._summary_seq = 0
+        # Append-only history next to the memory file; lines are queued and written on save()
+        self.archive_path = os.path.splitext(path)[0] + "_archive.jsonl"
+        self._archive_pending: List[str] = []
 
     def load(self):
+        normalize_task.cache_clear()
         raw = _read_json(self.path, default={})
+        stored_version = raw.get("schema_version")
         base = {
             "last_priority": None,
             "reflections": [],
@@ -74,6 +127,10 @@ class Memory:
             "emotion_history": [],
             "context_buffer": [],
             "session_summaries": [],
+            "reflection_count": None,
+            "insight_count": None,
+            "weights_sum": None,
+            "weights_count": None,
             "schema_version": SCHEMA_VERSION,
             "last_run": None,
             "extras": {},
@@ -95,50 +152,183 @@ class Memory:
         for key, typ in [("task_scores", dict), ("confidence_scores", dict), ("insight_weights", dict)]:
             if not isinstance(raw.get(key), typ): raw[key] = typ()
 
+        # migrations
+        if not isinstance(stored_version, int) or stored_version < 12:
+            # 12: reflections/insights become a hot window + archive, so their
+            # totals and the insight-weight aggregate are persisted alongside.
+            raw["reflection_count"] = len(raw["reflections"])
+            raw["insight_count"] = len(raw["insights"])
+            raw["weights_sum"] = raw["weights_count"] = None
         raw["schema_version"] = SCHEMA_VERSION
         self.data = raw
-
-    def save(self): _write_json(self.path, self.data)
-    def touch_run(self): self.data["last_run"] = iso_now()
-
-    def push_emotion(self, e: str, cap: int = 12):
-        self.data["emotion_history"].append(e)
-        self.data["emotion_history"] = self.data["emotion_history"][-cap:]
+        self._norm_index = {normalize_task(t): t for t in raw["open_tasks"]}
+        self._dupes_dirty = True   # sweep whatever was on disk once
+        if raw["weights_count"] == len(raw["insight_weights"]) and isinstance(raw["weights_sum"], (int, float)):
+            self._weights_sum, self._weights_count = float(raw["weights_sum"]), raw["weights_count"]
+        else:   # pre-12 file (or a stale aggregate): one scan
+            self._weights_sum = sum(float(v) for v in raw["insight_weights"].values())
+            self._weights_count = len(raw["insight_weights"])
+        self._rebuild_heap()
+        self._floored_at = None
+
+        raw["context_buffer"] = deque(raw["context_buffer"], maxlen=CONTEXT_CAP)
+        raw["emotion_history"] = deque(raw["emotion_history"], maxlen=EMOTION_CAP)
+        self._summary_heap = []
+        for i, sm in enumerate(raw["session_summaries"]):
+            emo = sm.split(" :: ", 1)[-1].split(" → ", 1)[0] if isinstance(sm, str) else ""
+            self._summary_heap.append((self._summary_key(emo, i), i, sm))
+        heapq.heapify(self._summary_heap)
+        self._summary_seq = len(raw["session_summaries"])
+
+        # Counts survive trimming; pre-12 files got them from the full lists above,
+        # and anything beyond the hot window moves to the archive on next save.
+        self._archive_pending = []
+        for kind, key, count in (("reflection", "reflections", "reflection_count"), ("insight", "insights", "insight_count")):
+            if not isinstance(raw[count], int): raw[count] = len(raw[key])
+            self._trim_hot(kind, key, raw[count])
+
+    def save(self):
+        self._flush_archive()   # history first, so the memory file never references unarchived lines
+        self.data["weights_sum"], self.data["weights_count"] = self._weights_sum, self._weights_count
+        _write_json(self.path, {k: list(v) if isinstance(v, deque) else v for k, v in self.data.items()})
+    def touch_run(self, now: str | None = None): self.data["last_run"] = now or iso_now()
+
+    # ----- Reflections / insights: hot window + append-only archive -----
+    def _archive(self, kind: str, n: int, text: str):
+        self._archive_pending.append(json.dumps({"kind": kind, "n": n, "text": text}, ensure_ascii=False) + "\n")
+
+    def _flush_archive(self):
+        if not self._archive_pending: return
+        with open(self.archive_path, "a", encoding="utf-8") as f:
+            f.write("".join(self._archive_pending))
+        self._archive_pending.clear()
+
+    def _trim_hot(self, kind: str, key: str, count: int):
+        lst = self.data[key]
+        if len(lst) <= HOT_KEEP: return
+        drop = len(lst) - HOT_KEEP
+        first_n = count - len(lst) + 1
+        for i, text in enumerate(lst[:drop]):
+            self._archive(kind, first_n + i, text)
+        del lst[:drop]
+
+    def add_reflection(self, text: str) -> int:
+        self.data["reflections"].append(text)
+        self.data["reflection_count"] += 1
+        self._trim_hot("reflection", "reflections", self.data["reflection_count"])
+        return self.data["reflection_count"]
+
+    def add_insight(self, text: str) -> int:
+        self.data["insights"].append(text)
+        self.data["insight_count"] += 1
+        self._trim_hot("insight", "insights", self.data["insight_count"])
+        return self.data["insight_count"]
+
+    # ----- Insight weights (aggregate kept incrementally) -----
+    def set_insight_weight(self, k: str, w: float):
+        old = self.data["insight_weights"].get(k)
+        if old is None:
+            self._weights_count += 1
+        else:
+            self._weights_sum -= float(old)
+        self.data["insight_weights"][k] = w
+        self._weights_sum += w
+
+    def avg_insight_weight(self) -> float:
+        return round(self._weights_sum / max(self._weights_count, 1), 2)
+
+    # ----- Session summaries: decay-weighted eviction -----
+    @staticmethod
+    def _summary_key(emotion: str, seq: int) -> float:
+        # log(weight * exp(-decay * (now - seq))) minus the shared now-term,
+        # so keys never need rescoring as time passes.
+        return math.log(SUMMARY_WEIGHTS.get(emotion, 0.5)) + SUMMARY_DECAY * seq
+
+    def add_summary(self, summary: str, emotion: str):
+        """Keep at most SUMMARY_BUDGET summaries, evicting the lowest priority (not just the oldest)."""
+        seq = self._summary_seq
+        self._summary_seq += 1
+        self.data["session_summaries"].append(summary)
+        heapq.heappush(self._summary_heap, (self._summary_key(emotion, seq), seq, summary))
+        while len(self.data["session_summaries"]) > SUMMARY_BUDGET and self._summary_heap:
+            _, _, victim = heapq.heappop(self._summary_heap)
+            self.data["session_summaries"].remove(victim)
+
+    def push_emotion(self, e: str):
+        self.data["emotion_history"].append(e)   # deque(maxlen=EMOTION_CAP)
 
     # ----- Duplicate Merge + Add -----
     def add_task(self, t: str, s: float):
         """Add a task with duplicate-aware merge. Keeps the higher score."""
         if not t: return
-        norm_map = {normalize_task(x): x for x in self.data["open_tasks"]}
+        t = sys.intern(t)   # same few templates every cycle: share one key object
         key = normalize_task(t)
-        if key in norm_map:
-            existing = norm_map[key]
-            prev = float(self.data["task_scores"].get(existing, 0))
-            self.data["task_scores"][existing] = round(max(prev, s), 3)
+        existing = self._norm_index.get(key)
+        if existing is not None:
+            # Already open under another spelling: the index means open_tasks gains
+            # no duplicate, so only a score bump needs any follow-up work.
+            scores = self.data["task_scores"]
+            live = float(scores.get(existing, 0.1))   # what its heap entry was keyed on
+            new = round(max(float(scores.get(existing, 0)), s), 3)
+            scores[existing] = new
+            if new != live:
+                self._floored_at = None
+                self._push_heap(existing, self._open_seq[existing])
             return
         self.data["open_tasks"].append(t)
+        self._norm_index[key] = t
         prev = float(self.data["task_scores"].get(t, 0))
         self.data["task_scores"][t] = round(max(prev, s), 3)
+        self._push_heap(t, self._next_seq)
+        self._next_seq += 1
+        self._floored_at = None
+
+    # ----- Top-task heap (ties resolve to the earliest task, like max()) -----
+    def _push_heap(self, t: str, seq: int):
+        self._open_seq[t] = seq
+        heapq.heappush(self._heap, (-float(self.data["task_scores"].get(t, 0.1)), seq, t))
+
+    def _rebuild_heap(self):
+        scores = self.data["task_scores"]
+        self._open_seq = {}
+        for i, t in enumerate(self.data["open_tasks"]):
+            self._open_seq.setdefault(t, i)
+        self._heap = [(-float(scores.get(t, 0.1)), i, t) for t, i in self._open_seq.items()]
+        heapq.heapify(self._heap)
+        self._next_seq = len(self.data["open_tasks"])
 
     def get_top_task(self) -> Tuple[str | None, float]:
         if not self.data["open_tasks"]:
             return None, 0.0
-        top = max(self.data["open_tasks"], key=lambda x: self.data["task_scores"].get(x, 0.1))
-        return top, float(self.data["task_scores"].get(top, 0.1))
+        scores = self.data["task_scores"]
+        heap = self._heap
+        while heap:
+            neg, seq, t = heap[0]
+            if self._open_seq.get(t) == seq and float(scores.get(t, 0.1)) == -neg:
+                return t, -neg
+            heapq.heappop(heap)   # stale: completed or rescored since push
+        self._rebuild_heap()
+        return self.get_top_task() if self._heap else (None, 0.0)
 
     def complete_task(self, t: str | None = None) -> Dict[str, Any]:
         if not self.data["open_tasks"]:
             return {"ok": False, "msg": "No open tasks."}
         if t is None:
             t, _ = self.get_top_task()
-        if t not in self.data["open_tasks"]:
+        if t not in self._open_seq:   # O(1): keys mirror open_tasks
             return {"ok": False, "msg": "Task not found."}
+        del self._open_seq[t]
         self.data["open_tasks"] = [x for x in self.data["open_tasks"] if x != t]
+        key = normalize_task(t)
+        if self._norm_index.get(key) == t:
+            del self._norm_index[key]
+        self._dupes_dirty = True
+        self._floored_at = None
         self.data["completed_tasks"].append(t)
         # Reinforce insights slightly
-        for k in list(self.data["insight_weights"].keys()):
-            w = float(self.data["insight_weights"][k])
-            self.data["insight_weights"][k] = round(min(1.0, w + 0.02), 3)
+        weights = {k: round(min(1.0, float(w) + 0.02), 3) for k, w in self.data["insight_weights"].items()}
+        self.data["insight_weights"] = weights
+        self._weights_sum = sum(weights.values())   # resync the running total (no float drift)
         self.data["last_priority"] = None
         return {"ok": True, "msg": f"Completed: {t}"}
 
@@ -147,27 +337,52 @@ class Memory:
         """
         - Priority Decay: multiply all task scores by `decay` to let stale tasks slowly drop.
         - Duplicate Merge: unify tasks that normalize to the same key (keeps highest score).
+          Skipped when nothing was merged/completed since the last pass.
         """
-        # Decay (do not decay the current top to avoid thrash)
-        top, _ = self.get_top_task()
+        decaying = self._floored_at != floor
+        if not decaying and not self._dupes_dirty:
+            return
+
+        # One pass: decay each score (never the current top, to avoid thrash) and,
+        # if needed, fold it straight into the duplicate merge.
+        # Once every other task sits at `floor`, decay is a no-op until a task is
+        # added/completed, so it is skipped.
+        top = self.get_top_task()[0] if decaying else None
+        scores = self.data["task_scores"]
+        merged: Dict[str, Tuple[str, float]] | None = {} if self._dupes_dirty else None
+        all_floor = True
         for t in list(self.data["open_tasks"]):
-            if t == top: 
+            sc = float(scores.get(t, 0.1))
+            if decaying and t != top:
+                sc = round(max(floor, sc * decay), 3)
+                if sc > floor: all_floor = False
+            if merged is None:
+                scores[t] = sc
                 continue
-            sc = float(self.data["task_scores"].get(t, 0.1))
-            self.data["task_scores"][t] = round(max(floor, sc * decay), 3)
-
-        # Merge duplicates across the whole list
-        merged: Dict[str, Tuple[str, float]] = {}
-        for t in self.data["open_tasks"]:
             key = normalize_task(t)
-            sc = float(self.data["task_scores"].get(t, 0.1))
-            if key not in merged or sc > merged[key][1]:
+            cur = merged.get(key)
+            if cur is None or sc > cur[1]:
                 merged[key] = (t, sc)
-        # Rebuild open_tasks and task_scores
-        self.data["open_tasks"] = [orig for orig, _ in merged.values()]
-        self.data["task_scores"] = {orig: round(score, 3) for orig, score in merged.values()}
+        if decaying:
+            self._floored_at = floor if all_floor else None
+
+        if merged is not None:
+            # Rebuild open_tasks and task_scores
+            self.data["open_tasks"] = [orig for orig, _ in merged.values()]
+            self.data["task_scores"] = {orig: round(score, 3) for orig, score in merged.values()}
+            self._norm_index = {key: orig for key, (orig, _) in merged.items()}
+            self._dupes_dirty = False
+
+        # Decay reorders everything: one heapify instead of per-op rescans
+        self._rebuild_heap()
 
 # ---------- Engine ----------
+# Emotion keywords, one compiled alternation per class (substring semantics kept:
+# reflections read like "Next=Plan: ...", so whitespace tokens would miss "plan").
+_KW_CURIOUS = re.compile(r"why|doubt|uncertain")
+_KW_REFLECTIVE = re.compile(r"fail|hard|struggle")
+_KW_MOTIVATED = re.compile(r"goal|achieve|plan|let's|move")
+
 class Engine:
     def __init__(self, memory: Memory):
         self.mem = memory
@@ -175,9 +390,9 @@ class Engine:
     # Emotion & confidence
     def analyze_emotion(self, text: str) -> str:
         t = (text or "").lower()
-        if any(x in t for x in ["why", "doubt", "uncertain"]): return "curious"
-        if any(x in t for x in ["fail", "hard", "struggle"]): return "reflective"
-        if any(x in t for x in ["goal", "achieve", "plan", "let's", "move"]): return "motivated"
+        if _KW_CURIOUS.search(t): return "curious"
+        if _KW_REFLECTIVE.search(t): return "reflective"
+        if _KW_MOTIVATED.search(t): return "motivated"
         return "neutral"
 
     def compute_confidence(self, text: str) -> int:
@@ -190,7 +405,7 @@ class Engine:
     def apply_emotion_drift(self, current: str) -> str:
         hist = self.mem.data.get("emotion_history", [])
         if len(hist) < 3: return current
-        last3 = hist[-3:]
+        last3 = _tail(hist, 3)
         if last3.count("motivated") == 3: return "curious"
         if last3.count("reflective") >= 2: return "motivated"
         return current
@@ -198,14 +413,16 @@ class Engine:
     # Priority suggestion from history
     def chain_next_priority(self, base: str | None) -> str:
         hist = self.mem.data.get("emotion_history", [])
-        last3 = hist[-3:]
+        last3 = _tail(hist, 3)
         if last3.count("reflective") >= 2: return "Plan: Convert reflection to a concrete next step."
         if last3.count("curious") >= 2: return "Plan: Formulate a testable question and act."
         if last3.count("motivated") >= 2: return "Plan: Execute a high-confidence action now."
         return base or "Plan: Define a clear goal and first task."
 
     # Scores & tasks
-    def score_task(self, base: float, e: str, c: int) -> float:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)   # pure; a handful of (weight, emotion, confidence) combos
+    def score_task(base: float, e: str, c: int) -> float:
         s = base
         if e == "motivated": s += 0.1
         elif e == "reflective": s += 0.05
@@ -220,20 +437,20 @@ class Engine:
             f"List 3 concrete steps toward: {base}.",
             f"Do a 5-minute starter action for: {base}.",
         ]
-        return [(t, self.score_task(w, e, c)) for t in templates]
+        score = self.score_task(w, e, c)
+        return [(sys.intern(t), score) for t in templates]
 
     # Context buffer + one-line summary
-    def update_context_and_summary(self, thought: str, emotion: str) -> str:
-        buf = self.mem.data.get("context_buffer", [])
-        buf.append(thought)
-        self.mem.data["context_buffer"] = buf[-5:]
-        last = self.mem.data["context_buffer"][-3:]
-        summary = f"{iso_now()} :: {emotion} → " + " | ".join(x.split('] ', 1)[-1] for x in last)
-        self.mem.data["session_summaries"].append(summary)
-        self.mem.data["session_summaries"] = self.mem.data["session_summaries"][-200:]
+    def update_context_and_summary(self, thought: str, emotion: str, now: str | None = None) -> str:
+        buf = self.mem.data["context_buffer"]
+        buf.append(thought)   # deque(maxlen=CONTEXT_CAP) drops the oldest
+        last = _tail(buf, 3)
+        summary = f"{now or iso_now()} :: {emotion} → " + " | ".join(x.split('] ', 1)[-1] for x in last)
+        self.mem.add_summary(summary, emotion)
         return summary
 
-    def reflect_once(self) -> Dict[str, Any]:
+    def reflect_once(self, now: str | None = None) -> Dict[str, Any]:
+        now = now or iso_now()   # one timestamp for the whole cycle
         m = self.mem
         prev = m.data.get("reflections", [])
         last_text = prev[-1] if prev else ""
@@ -244,19 +461,18 @@ class Engine:
         m.push_emotion(emotion)
 
         hint = self.chain_next_priority(m.data.get("last_priority"))
-        thought = f"[{iso_now()}] Emotion={emotion} | Next={hint}"
-        m.data["reflections"].append(thought)
-        m.data["confidence_scores"][str(len(prev))] = conf
+        thought = f"[{now}] Emotion={emotion} | Next={hint}"
+        n_refl = m.add_reflection(thought)
+        m.data["confidence_scores"][str(n_refl)] = conf
 
-        summary = self.update_context_and_summary(thought, emotion)
+        summary = self.update_context_and_summary(thought, emotion, now)
 
         # Every 3 reflections → insight + tasks
         new_tasks = []
-        if len(m.data["reflections"]) % 3 == 0:
+        if n_refl % 3 == 0:
             weight = round(min(1.0, conf / 5 + (0.2 if emotion == 'motivated' else 0.1 if emotion == 'reflective' else 0)), 2)
             ins = f"Insight: derived from {emotion} state — {hint}"
-            m.data["insights"].append(ins)
-            m.data["insight_weights"][str(len(m.data['insights']))] = weight
+            m.set_insight_weight(str(m.add_insight(ins)), weight)
             new_tasks = self.generate_tasks(ins, weight, emotion, conf)
             for t, s in new_tasks:
                 m.add_task(t, s)
@@ -271,15 +487,14 @@ class Engine:
 
 # ---------- Display ----------
 def banner(mem: Memory, r: Dict[str, Any]) -> str:
-    weights = mem.data.get("insight_weights", {})
-    avg = round(sum(float(v) for v in weights.values()) / max(len(weights), 1), 2) if weights else 0.0
-    em = ", ".join(mem.data.get("emotion_history", [])[-5:])
+    avg = mem.avg_insight_weight()
+    em = ", ".join(_tail(mem.data.get("emotion_history", []), 5))
     top = r.get("top") or "None"
     latest_summary = (mem.data.get("session_summaries") or ["n/a"])[-1]
     return (
         f"Thinking Engine {VERSION} Online\n"
         f"- Emotion: {r.get('emotion')} | Confidence: {r.get('confidence')}/5\n"
-        f"- Reflections: {len(mem.data['reflections'])} | Insights: {len(mem.data['insights'])} (avg {avg})\n"
+        f"- Reflections: {mem.data['reflection_count']} | Insights: {mem.data['insight_count']} (avg {avg})\n"
         f"- Tasks: {len(mem.data['open_tasks'])} | Completed: {len(mem.data['completed_tasks'])}\n"
         f"- Top: {top}\n"
         f"- Next: {r.get('next')}\n"
@@ -298,75 +513,104 @@ def print_task_list(mem: Memory):
         print(f"{i}. {t}")
 
 # ---------- Logging ----------
+def _migrate_legacy_log():
+    """One-time: fold the old JSON-list session log into the JSONL log, ahead of any newer lines."""
+    if not os.path.isfile(LEGACY_SESSION_LOG): return
+    old = _read_json(LEGACY_SESSION_LOG, default=[])
+    if not isinstance(old, list): old = []
+    lines = [json.dumps(e, ensure_ascii=False) + "\n" for e in old[-SESSION_LOG_KEEP:]]
+    if os.path.isfile(SESSION_LOG):
+        with open(SESSION_LOG, "r", encoding="utf-8") as f:
+            lines.extend(f)
+    tmp = f"{SESSION_LOG}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    os.replace(tmp, SESSION_LOG)
+    os.remove(LEGACY_SESSION_LOG)
+
+def _rotate_log_if_big():
+    """Trim the JSONL session log to its last SESSION_LOG_KEEP lines once it gets large."""
+    try:
+        if os.path.getsize(SESSION_LOG) <= SESSION_LOG_MAX_BYTES: return
+        with open(SESSION_LOG, "r", encoding="utf-8") as f:
+            tail = deque(f, maxlen=SESSION_LOG_KEEP)
+    except OSError:
+        return
+    tmp = f"{SESSION_LOG}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(tail)
+    os.replace(tmp, SESSION_LOG)
+
 def log(entry: Dict[str, Any]):
-    lg = _read_json(SESSION_LOG, default=[])
-    if not isinstance(lg, list): lg = []
-    lg.append(entry)
-    lg = lg[-500:]
-    _write_json(SESSION_LOG, lg)
+    log_many([entry])
+
+def log_many(entries: List[Dict[str, Any]]):
+    if not entries: return
+    with open(SESSION_LOG, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries))
+    _rotate_log_if_big()
 
 # ---------- Exporters ----------
 def export_markdown(mem: Memory) -> str:
     weights = mem.data.get("insight_weights", {})
-    avg_w = round(sum(float(v) for v in weights.values()) / max(len(weights), 1), 2) if weights else 0.0
-    emotions = ", ".join(mem.data.get("emotion_history", [])[-12:])
+    avg_w = mem.avg_insight_weight()
+    emotions = ", ".join(_tail(mem.data.get("emotion_history", []), 12))
     top_task, top_score = mem.get_top_task()
     summaries = mem.data.get("session_summaries", [])[-10:]
     insights = mem.data.get("insights", [])[-10:]
     reflections = mem.data.get("reflections", [])[-10:]
-
-    lines = []
-    lines.append(f"# Nivora Thinking Engine — Session Report\n")
-    lines.append(f"- **Version:** {VERSION}")
-    lines.append(f"- **Generated:** {iso_now()}")
-    lines.append(f"- **Schema:** v{SCHEMA_VERSION}")
-    lines.append("")
-    lines.append("## Snapshot")
-    lines.append(f"- Reflections: **{len(mem.data['reflections'])}**  |  Insights: **{len(mem.data['insights'])}** (avg weight **{avg_w}**)  |  Goals: **{len(mem.data['goals'])}**")
-    lines.append(f"- Tasks: **{len(mem.data['open_tasks'])}** open, **{len(mem.data['completed_tasks'])}** completed")
-    lines.append(f"- Top Task: **{top_task or 'None'}**  (score {round(top_score,2)})")
-    lines.append(f"- Emotion history (latest 12): {emotions or 'n/a'}")
-    lines.append("")
-    lines.append("## Latest Summaries (≤10)")
-    if summaries:
-        for s in summaries: lines.append(f"- {s}")
-    else:
-        lines.append("- n/a")
-    lines.append("")
-    lines.append("## Recent Insights (≤10)")
-    if insights:
-        total = len(mem.data['insights'])
-        start_idx = max(1, total - len(insights) + 1)
-        for i, ins in enumerate(insights, start=start_idx):
-            lines.append(f"{i}. {ins}  *(w={mem.data.get('insight_weights', {}).get(str(i), '—')})*")
-    else:
-        lines.append("- n/a")
-    lines.append("")
-    lines.append("## Recent Reflections (≤10)")
-    if reflections:
-        for r in reflections: lines.append(f"- {r}")
-    else:
-        lines.append("- n/a")
-    lines.append("")
-    lines.append("## Open Tasks")
-    if mem.data.get("open_tasks"):
-        for t in mem.data["open_tasks"]:
-            lines.append(f"- [ ] {t}  *(score {round(float(mem.data['task_scores'].get(t,0)),2)})*")
-    else:
-        lines.append("- none")
-    lines.append("")
-    lines.append("## Completed Tasks")
-    if mem.data.get("completed_tasks"):
-        for t in mem.data["completed_tasks"]:
-            lines.append(f"- [x] {t}")
-    else:
-        lines.append("- none")
-    lines.append("")
-    lines.append("> End of report.")
+    scores = mem.data.get("task_scores", {})
 
     fn = os.path.join(REPORT_DIR, f"Session_{_short_ts()}.md")
     with open(fn, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        w = f.write
+        w(f"# Nivora Thinking Engine — Session Report\n\n")
+        w(f"- **Version:** {VERSION}\n")
+        w(f"- **Generated:** {iso_now()}\n")
+        w(f"- **Schema:** v{SCHEMA_VERSION}\n")
+        w("\n")
+        w("## Snapshot\n")
+        w(f"- Reflections: **{mem.data['reflection_count']}**  |  Insights: **{mem.data['insight_count']}** (avg weight **{avg_w}**)  |  Goals: **{len(mem.data['goals'])}**\n")
+        w(f"- Tasks: **{len(mem.data['open_tasks'])}** open, **{len(mem.data['completed_tasks'])}** completed\n")
+        w(f"- Top Task: **{top_task or 'None'}**  (score {round(top_score,2)})\n")
+        w(f"- Emotion history (latest 12): {emotions or 'n/a'}\n")
+        w("\n")
+        w("## Latest Summaries (≤10)\n")
+        if summaries:
+            for s in summaries: w(f"- {s}\n")
+        else:
+            w("- n/a\n")
+        w("\n")
+        w("## Recent Insights (≤10)\n")
+        if insights:
+            total = mem.data['insight_count']
+            start_idx = max(1, total - len(insights) + 1)
+            for i, ins in enumerate(insights, start=start_idx):
+                w(f"{i}. {ins}  *(w={weights.get(str(i), '—')})*\n")
+        else:
+            w("- n/a\n")
+        w("\n")
+        w("## Recent Reflections (≤10)\n")
+        if reflections:
+            for r in reflections: w(f"- {r}\n")
+        else:
+            w("- n/a\n")
+        w("\n")
+        w("## Open Tasks\n")
+        if mem.data.get("open_tasks"):
+            for t in mem.data["open_tasks"]:
+                w(f"- [ ] {t}  *(score {round(float(scores.get(t,0)),2)})*\n")
+        else:
+            w("- none\n")
+        w("\n")
+        w("## Completed Tasks\n")
+        if mem.data.get("completed_tasks"):
+            for t in mem.data["completed_tasks"]:
+                w(f"- [x] {t}\n")
+        else:
+            w("- none\n")
+        w("\n")
+        w("> End of report.")
     return fn
 
 def export_csv(mem: Memory) -> str:
@@ -374,16 +618,14 @@ def export_csv(mem: Memory) -> str:
     top_task, top_score = mem.get_top_task()
     summaries = mem.data.get("session_summaries", [])
     last_summary = summaries[-1] if summaries else ""
+    avg_w = mem.avg_insight_weight()
     row = {
         "timestamp": iso_now(),
-        "reflections": len(mem.data.get("reflections", [])),
-        "insights": len(mem.data.get("insights", [])),
-        "avg_insight_weight": round(
-            sum(float(v) for v in mem.data.get("insight_weights", {}).values()) / max(len(mem.data.get("insight_weights", {})) or 1, 1),
-            2
-        ) if mem.data.get("insight_weights") else 0.0,
+        "reflections": mem.data["reflection_count"],
+        "insights": mem.data["insight_count"],
+        "avg_insight_weight": avg_w,
         "emotion_recent": (mem.data.get("emotion_history") or ["n/a"])[-1],
-        "emotion_trend_last5": ", ".join(mem.data.get("emotion_history", [])[-5:]),
+        "emotion_trend_last5": ", ".join(_tail(mem.data.get("emotion_history", []), 5)),
         "top_task": top_task or "",
         "top_score": round(top_score, 2),
         "open_tasks": len(mem.data.get("open_tasks", [])),
@@ -403,14 +645,11 @@ def export_status_json(mem: Memory) -> str:
         "version": VERSION,
         "schema": SCHEMA_VERSION,
         "generated": iso_now(),
-        "reflections": len(mem.data.get("reflections", [])),
-        "insights": len(mem.data.get("insights", [])),
-        "avg_insight_weight": round(
-            sum(float(v) for v in mem.data.get("insight_weights", {}).values()) / max(len(mem.data.get("insight_weights", {})) or 1, 1),
-            2
-        ) if mem.data.get("insight_weights") else 0.0,
+        "reflections": mem.data["reflection_count"],
+        "insights": mem.data["insight_count"],
+        "avg_insight_weight": mem.avg_insight_weight(),
         "emotion_recent": (mem.data.get("emotion_history") or ["n/a"])[-1],
-        "emotion_trend_last5": mem.data.get("emotion_history", [])[-5:],
+        "emotion_trend_last5": _tail(mem.data.get("emotion_history", []), 5),
         "top_task": top_task,
         "top_score": round(top_score, 2),
         "open_tasks": mem.data.get("open_tasks", []),
@@ -418,7 +657,7 @@ def export_status_json(mem: Memory) -> str:
         "session_summaries": mem.data.get("session_summaries", [])[-10:],
         "goals": mem.data.get("goals", []),
     }
-    _write_json(fn, status)
+    _write_json(fn, status, atomic=False)
     return fn
 
 # ---------- Main ----------
@@ -441,9 +680,11 @@ def main():
     parser.add_argument("--export-md", action="store_true", help="Export Markdown report and exit.")
     parser.add_argument("--export-csv", action="store_true", help="Export CSV report and exit.")
     parser.add_argument("--status", action="store_true", help="Print short JSON status to stdout and exit.")
+    parser.add_argument("--save-every", type=int, default=10, help="Autoloop: persist memory + log every N cycles.")
     args = parser.parse_args()
 
     _ensure_dirs()
+    _migrate_legacy_log()
     mem = Memory(MEMORY_PATH)
     mem.load()
     eng = Engine(mem)
@@ -482,14 +723,23 @@ def main():
     # Autoloop (planning/reflection)
     last_report = {}
     cycles = max(1, args.cycles)
-    for i in range(cycles):
-        r = eng.reflect_once()
-        mem.touch_run()
-        mem.save()
-        log({"ts": iso_now(), "version": VERSION, "mode": "cycle", "cycle": i+1, "report": r})
-        print(f"[cycle {i+1}/{cycles}] emotion={r['emotion']} conf={r['confidence']} top={r.get('top') or 'None'} tasks={len(mem.data['open_tasks'])}")
-        last_report = r
-        time.sleep(0.05)
+    save_every = max(1, args.save_every)
+    pending_logs: List[Dict[str, Any]] = []
+    try:
+        for i in range(cycles):
+            now = iso_now()
+            r = eng.reflect_once(now)
+            mem.touch_run(now)
+            pending_logs.append({"ts": now, "version": VERSION, "mode": "cycle", "cycle": i+1, "report": r})
+            if (i + 1) % save_every == 0:
+                mem.save(); log_many(pending_logs); pending_logs.clear()
+            print(f"[cycle {i+1}/{cycles}] emotion={r['emotion']} conf={r['confidence']} top={r.get('top') or 'None'} tasks={len(mem.data['open_tasks'])}")
+            last_report = r
+            time.sleep(0.05)
+    finally:
+        # Flush whatever the last partial batch holds (also on error / Ctrl-C)
+        if pending_logs:
+            mem.save(); log_many(pending_logs)
 
     # Final banner + auto-export
     banner_and_print(mem, last_report)
@@ -14,11 +14,22 @@ any client) can send a base campaign and receive:
 Endpoint:
 
     POST /campaign-brain
+
+Run:
+
+    uvicorn api_campaign_brain_v1:app --loop uvloop --http httptools --no-access-log
+
+Keep it to one worker: the brain's Book of Truth lives in process memory,
+so with several workers an update_book_of_truth() only reaches the worker
+that handled it.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from engine_campaign_brain_v1 import run_campaign_brain
@@ -63,16 +74,18 @@ app = FastAPI(
     title="Nivora Campaign Brain API",
     description="Full campaign brain (scenarios + media + safety) for Nivora.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 @app.get("/")
-def root() -> Dict[str, str]:
-    return {"status": "ok", "message": "Nivora Campaign Brain API is running"}
+async def root() -> ORJSONResponse:
+    return ORJSONResponse({"status": "ok", "message": "Nivora Campaign Brain API is running"})
 
 
-@app.post("/campaign-brain")
-def campaign_brain_endpoint(payload: CampaignBrainRequest) -> Dict[str, Any]:
+@app.post("/campaign-brain", response_model=None)
+async def campaign_brain_endpoint(payload: CampaignBrainRequest) -> ORJSONResponse:
     """
     Run the campaign brain orchestration.
     """
@@ -83,11 +96,14 @@ def campaign_brain_endpoint(payload: CampaignBrainRequest) -> Dict[str, Any]:
     perf = payload.performance_metrics.dict() if payload.performance_metrics else None
     algo = payload.algo_metrics.dict() if payload.algo_metrics else None
 
-    result = run_campaign_brain(
+    # The brain is sync and writes media files: keep it off the event loop
+    result = await asyncio.to_thread(
+        run_campaign_brain,
         base_campaign=base_campaign_dict,
         performance_metrics=perf,
         algo_metrics=algo,
         max_scenarios=payload.max_scenarios or 10,
         top_n=payload.top_n or 3,
     )
-    return result
\ No newline at end of file
+    # Plain dicts/lists from the brain: hand them straight to orjson
+    return ORJSONResponse(result)
\ No newline at end of file
@@ -1,52 +1,112 @@
 from __future__ import annotations
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from bubble_campaign_contract_v1 import BubbleCampaign
 
 
+# Fixed labels, filled in one format pass (parsers in Nicole/Jon/Maya/Sam key on them).
+_BRIEF_TEMPLATE = (
+    "You are operating inside Nivora.\n"
+    "Use only the campaign context below. Do not ask for DMs or private messages. No autonomous posting.\n"
+    "\n"
+    "Campaign Title: {title}\n"
+    "Niche: {niche}\n"
+    "Platform: {platform}\n"
+    "Goal: {goal}\n"
+    "Target audience: {target_audience}\n"
+    "Tone: {tone}\n"
+    "Style: {style}\n"
+    "Offer: {main_offer}\n"
+    "Studio theme: {studio_theme}\n"
+    "Overview: {overview}\n"
+    "Description: {description}\n"
+    "\n"
+    "Execution prefs:\n"
+    "ab_test: {ab_test}\n"
+    "auto_optimize: {auto_optimize}\n"
+    "optimal_posting_time: {optimal_posting_time}\n"
+    "\n"
+    "Consent flags:\n"
+    "allow_ai_to_post: {allow_ai_to_post}\n"
+    "approved_for_posting: {approved_for_posting}\n"
+    "content_approved: {content_approved}\n"
+    "\n"
+    "Recent metrics (if present):\n"
+    "Views: {views}\n"
+    "Clicks: {clicks}\n"
+    "Impressions: {impressions}\n"
+    "Engagement rate: {engagement_rate}\n"
+    "Conversion: {conversion}\n"
+    "avg_post_performance: {avg_post_performance}\n"
+    "Algo health: {algo_health}"
+)
+
+
+_BRIEF_KEYS = (
+    "title", "niche", "platform", "goal", "target_audience", "tone", "style",
+    "main_offer", "studio_theme", "overview", "description",
+    "ab_test", "auto_optimize", "optimal_posting_time",
+    "allow_ai_to_post", "approved_for_posting", "content_approved",
+    "views", "clicks", "impressions", "engagement_rate", "conversion",
+    "avg_post_performance", "algo_health",
+)
+_BRIEF_CACHE_WINDOW = 256     # calls between hit-rate checks
+_BRIEF_CACHE_MIN_HIT = 0.3    # below this the cache is just churn: drop it
+
+
+def _or_blank(v: Any) -> Any:
+    return "" if v is None else v
+
+
+@lru_cache(maxsize=512)
+def _brief_from_key(key: Tuple[Any, ...]) -> str:
+    return _BRIEF_TEMPLATE.format_map(dict(zip(_BRIEF_KEYS, key)))
+
+
+def _check_brief_cache() -> None:
+    info = _brief_from_key.cache_info()
+    calls = info.hits + info.misses
+    if calls >= _BRIEF_CACHE_WINDOW and info.hits < _BRIEF_CACHE_MIN_HIT * calls:
+        _brief_from_key.cache_clear()
+
+
 def campaign_brief(c: BubbleCampaign) -> str:
     """
     Bubble Campaign -> clean brief for the AI family.
     IMPORTANT: This brief must include the same labels every time
     so parsers in Nicole/Jon/Maya/Sam stay stable.
     """
-    platform = c.resolved_platform() or "unknown"
-
-    lines = [
-        "You are operating inside Nivora.",
-        "Use only the campaign context below. Do not ask for DMs or private messages. No autonomous posting.",
-        "",
-        f"Campaign Title: {c.Title or ''}",
-        f"Niche: {c.niche}",
-        f"Platform: {platform}",
-        f"Goal: {c.Goal}",
-        f"Target audience: {c.target_audience or ''}",
-        f"Tone: {c.tone or ''}",
-        f"Style: {c.style or ''}",
-        f"Offer: {c.main_offer or ''}",
-        f"Studio theme: {c.studio_theme or ''}",
-        f"Overview: {c.overview or ''}",
-        f"Description: {c.Descriptions or ''}",
-        "",
-        "Execution prefs:",
-        f"ab_test: {bool(c.ab_test)}",
-        f"auto_optimize: {bool(c.auto_optimize)}",
-        f"optimal_posting_time: {c.optimal_posting_time or ''}",
-        "",
-        "Consent flags:",
-        f"allow_ai_to_post: {bool(c.allow_ai_to_post)}",
-        f"approved_for_posting: {bool(c.approved_for_posting)}",
-        f"content_approved: {bool(c.content_approved)}",
-        "",
-        "Recent metrics (if present):",
-        f"Views: {c.Views if c.Views is not None else ''}",
-        f"Clicks: {c.Clicks if c.Clicks is not None else ''}",
-        f"Impressions: {c.Impressions if c.Impressions is not None else ''}",
-        f"Engagement rate: {c.engagement_rate if c.engagement_rate is not None else ''}",
-        f"Conversion: {c.conversion if c.conversion is not None else ''}",
-        f"avg_post_performance: {c.avg_post_performance if c.avg_post_performance is not None else ''}",
-        f"Algo health: {c.algo_health if c.algo_health is not None else ''}",
-    ]
-    return "\n".join(lines)
+    # Same campaign parsed by several agents -> same brief; key order = _BRIEF_KEYS.
+    # BubbleCampaign coerces metrics to float, so 1 vs 1.0 can't alias in the cache.
+    key = (
+        c.Title or "",
+        c.niche,
+        c.resolved_platform() or "unknown",
+        c.Goal,
+        c.target_audience or "",
+        c.tone or "",
+        c.style or "",
+        c.main_offer or "",
+        c.studio_theme or "",
+        c.overview or "",
+        c.Descriptions or "",
+        bool(c.ab_test),
+        bool(c.auto_optimize),
+        c.optimal_posting_time or "",
+        bool(c.allow_ai_to_post),
+        bool(c.approved_for_posting),
+        bool(c.content_approved),
+        _or_blank(c.Views),
+        _or_blank(c.Clicks),
+        _or_blank(c.Impressions),
+        _or_blank(c.engagement_rate),
+        _or_blank(c.conversion),
+        _or_blank(c.avg_post_performance),
+        _or_blank(c.algo_health),
+    )
+    brief = _brief_from_key(key)
+    _check_brief_cache()
+    return brief
 
 
 def bubble_truth_packet(c: BubbleCampaign) -> Dict[str, Any]:
@@ -23,13 +23,27 @@ from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CampaignPerformanceCheck:
     is_dead: bool
     reasons: str
     recommendation: str
 
 
+# Reason for each rule, indexed by its bit in the rule mask.
+_REASONS = (
+    "Low impressions despite spend",
+    "CTR below 0.5% after 1000+ impressions",
+    "No conversions after significant spend",
+)
+_ACCEPTABLE = "Performance is acceptable; campaign is not considered dead in v1 rules."
+_DEAD_RECOMMENDATION = (
+    "Do NOT repost this campaign as-is. Create a new version: "
+    "change hook, creative, audience, or offer before relaunch."
+)
+_ALIVE_RECOMMENDATION = "You may iterate carefully, but continue monitoring performance."
+
+
 def evaluate_campaign_performance(metrics: Dict[str, Any]) -> CampaignPerformanceCheck:
     """
     Decide whether a campaign is "dead" based on simple thresholds.
@@ -39,48 +53,24 @@ def evaluate_campaign_performance(metrics: Dict[str, Any]) -> CampaignPerformanc
       - ctr < 0.5% after 1000+ impressions -> dead
       - conversions == 0 after decent spend -> dead
     """
-    impressions = int(metrics.get("impressions", 0))
-    clicks = int(metrics.get("clicks", 0))
-    conversions = int(metrics.get("conversions", 0))
-    spend = float(metrics.get("spend", 0.0))
-
-    ctr = float(metrics.get("ctr", 0.0))
-    if impressions > 0 and clicks > 0:
-        ctr = clicks / impressions
-
-    reasons = []
-    is_dead = False
-
-    # Rule 1: Very low reach with spend
-    if impressions < 500 and spend > 0:
-        is_dead = True
-        reasons.append("Low impressions despite spend")
-
-    # Rule 2: Very low CTR after enough impressions
-    if impressions >= 1000 and ctr < 0.005:  # 0.5%
-        is_dead = True
-        reasons.append("CTR below 0.5% after 1000+ impressions")
-
-    # Rule 3: No conversions after decent spend
-    if conversions == 0 and spend >= 50:
-        is_dead = True
-        reasons.append("No conversions after significant spend")
-
-    if not reasons:
-        reasons.append("Performance is acceptable; campaign is not considered dead in v1 rules.")
-
-    if is_dead:
-        recommendation = (
-            "Do NOT repost this campaign as-is. Create a new version: "
-            "change hook, creative, audience, or offer before relaunch."
-        )
-    else:
-        recommendation = "You may iterate carefully, but continue monitoring performance."
+    impressions: int = int(metrics.get("impressions", 0))
+    clicks: int = int(metrics.get("clicks", 0))
+    conversions: int = int(metrics.get("conversions", 0))
+    spend: float = float(metrics.get("spend", 0.0))
+    ctr: float = clicks / impressions if impressions > 0 and clicks > 0 else float(metrics.get("ctr", 0.0))
+
+    mask: int = (
+        (1 if impressions < 500 and spend > 0 else 0)          # Rule 1: very low reach with spend
+        | (2 if impressions >= 1000 and ctr < 0.005 else 0)    # Rule 2: CTR < 0.5% after enough impressions
+        | (4 if conversions == 0 and spend >= 50 else 0)       # Rule 3: no conversions after decent spend
+    )
 
+    if not mask:
+        return CampaignPerformanceCheck(is_dead=False, reasons=_ACCEPTABLE, recommendation=_ALIVE_RECOMMENDATION)
     return CampaignPerformanceCheck(
-        is_dead=is_dead,
-        reasons="; ".join(reasons),
-        recommendation=recommendation,
+        is_dead=True,
+        reasons="; ".join(r for i, r in enumerate(_REASONS) if mask & (1 << i)),
+        recommendation=_DEAD_RECOMMENDATION,
     )
 
 
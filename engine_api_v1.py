@@ -1,5 +1,21 @@
+"""
+engine_api_v1.py
+
+Nivora Thinking Engine API: mounts the Nicole / Jon / Maya / Sam / Kai routers.
+
+Run (uvloop + httptools event loop/parser, no per-request access log):
+
+    uvicorn engine_api_v1:app --loop uvloop --http httptools --no-access-log
+
+Keep it to one worker: Nicole's BOOK_OF_TRUTH lives in process memory, so
+with several workers a set_brand_profile() only reaches the worker that
+handled it.
+"""
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # import routers
 from router.nicole_strategist_v1 import router as nicole_router
@@ -10,7 +26,8 @@ from router.kai_creative_v1 import router as kai_router
 
 app = FastAPI(
     title="Nivora Thinking Engine API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -20,10 +37,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Only large bodies (e.g. Kai prompts) are worth compressing; /health never is.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 @app.get("/health")
-def health():
-    return {"status": "ok"}
+async def health():
+    return ORJSONResponse({"status": "ok"})
 
 app.include_router(nicole_router, prefix="/nicole", tags=["Nicole"])
 app.include_router(jon_router, prefix="/jon", tags=["Jon"])
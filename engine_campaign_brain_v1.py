@@ -1,5 +1,7 @@
+import re
 from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Literal
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional
 
 # ---------------------------------------------------------
 # Role + capabilities config (Nivora Family Rules in code)
@@ -7,40 +9,48 @@ from typing import Any, Dict, List, Literal
 
 Role = Literal["nicole", "sam", "jon", "maya"]
 
-AI_ROLES: Dict[Role, Dict[str, bool]] = {
-    "nicole": {
-        "can_override_plan": True,
-        "can_alert": False,
-        "can_experiment": False,
-        "can_explain": True,
-    },
-    "sam": {
-        "can_override_plan": False,
-        "can_alert": True,      # can raise warnings about performance
-        "can_experiment": False,
-        "can_explain": False,
-    },
-    "jon": {
-        "can_override_plan": False,
-        "can_alert": False,
-        "can_experiment": True,  # sandbox tests inside Nicole’s direction
-        "can_explain": False,
-    },
-    "maya": {
-        "can_override_plan": False,
-        "can_alert": False,
-        "can_experiment": False,
-        "can_explain": True,    # coaching / explanations
-    },
+# Each role's capabilities are bound once here and handed to the handlers
+# directly. They stay plain dicts (not MappingProxyType) because they are
+# embedded in response metadata, which must remain JSON-serializable.
+_NICOLE_CAPS: Dict[str, bool] = {
+    "can_override_plan": True,
+    "can_alert": False,
+    "can_experiment": False,
+    "can_explain": True,
+}
+_SAM_CAPS: Dict[str, bool] = {
+    "can_override_plan": False,
+    "can_alert": True,      # can raise warnings about performance
+    "can_experiment": False,
+    "can_explain": False,
+}
+_JON_CAPS: Dict[str, bool] = {
+    "can_override_plan": False,
+    "can_alert": False,
+    "can_experiment": True,  # sandbox tests inside Nicole’s direction
+    "can_explain": False,
+}
+_MAYA_CAPS: Dict[str, bool] = {
+    "can_override_plan": False,
+    "can_alert": False,
+    "can_experiment": False,
+    "can_explain": True,    # coaching / explanations
 }
 
+AI_ROLES: Mapping[Role, Dict[str, bool]] = MappingProxyType({
+    "nicole": _NICOLE_CAPS,
+    "sam": _SAM_CAPS,
+    "jon": _JON_CAPS,
+    "maya": _MAYA_CAPS,
+})
+
 # ---------------------------------------------------------
 # Book of Truth = official niche / content / goals
 # Only Nicole can change this.
 # ---------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class BookOfTruth:
     niche: str = ""
     content_type: str = ""
@@ -50,19 +60,24 @@ class BookOfTruth:
 
 BOOK_OF_TRUTH = BookOfTruth()
 
+# Bumped on every update; get_book_of_truth() re-snapshots only when it moves.
+_BOT_VERSION = 0
+_BOT_SNAPSHOT: Dict[str, Any] = {}
+_BOT_SNAPSHOT_VERSION = -1
+
 # ---------------------------------------------------------
 # Request / Response dataclasses
 # ---------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class BrainRequest:
     role: Role
     message: str
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BrainResponse:
     role: Role
     message: str
@@ -79,6 +94,8 @@ def update_book_of_truth(role: Role, updates: Dict[str, Any]) -> BookOfTruth:
     Only Nicole is allowed to update the Book of Truth.
     Everyone else can read it but not change it.
     """
+    global _BOT_VERSION
+
     if role != "nicole":
         raise PermissionError("Only Nicole can change the Book of Truth.")
 
@@ -91,15 +108,24 @@ def update_book_of_truth(role: Role, updates: Dict[str, Any]) -> BookOfTruth:
     if "goals" in updates and isinstance(updates["goals"], list):
         BOOK_OF_TRUTH.goals = [str(g) for g in updates["goals"]]
 
+    _BOT_VERSION += 1
     return BOOK_OF_TRUTH
 
 
-def get_book_of_truth() -> Dict[str, Any]:
+def get_book_of_truth() -> Mapping[str, Any]:
     """
     Read-only view of the Book of Truth.
     Safe for any role to call.
+    The snapshot is shared between calls until the next update, hence the proxy.
     """
-    return asdict(BOOK_OF_TRUTH)
+    global _BOT_SNAPSHOT, _BOT_SNAPSHOT_VERSION
+
+    if _BOT_SNAPSHOT_VERSION != _BOT_VERSION:
+        snapshot = asdict(BOOK_OF_TRUTH)
+        snapshot["goals"] = tuple(snapshot["goals"])
+        _BOT_SNAPSHOT = snapshot
+        _BOT_SNAPSHOT_VERSION = _BOT_VERSION
+    return MappingProxyType(_BOT_SNAPSHOT)
 
 
 # ---------------------------------------------------------
@@ -107,13 +133,10 @@ def get_book_of_truth() -> Dict[str, Any]:
 # ---------------------------------------------------------
 
 
-def is_safe_content(text: str) -> bool:
-    """
-    VERY simple placeholder safety check.
-    Later you can replace this with something smarter,
-    but this enforces your "positive, safe, non-shady" rule.
-    """
-    unsafe_keywords = [
+# One case-insensitive scan instead of lower() + a substring test per keyword.
+# No word boundaries on purpose: "scammer", "hateful", "guns" must still trip it.
+_UNSAFE_RE = re.compile(
+    "|".join([
         "scam",
         "fraud",
         "violence",
@@ -123,9 +146,18 @@ def is_safe_content(text: str) -> bool:
         "porn",
         "hate",
         "terror",
-    ]
-    lower = text.lower()
-    return not any(bad in lower for bad in unsafe_keywords)
+    ]),
+    re.IGNORECASE,
+)
+
+
+def is_safe_content(text: str) -> bool:
+    """
+    VERY simple placeholder safety check.
+    Later you can replace this with something smarter,
+    but this enforces your "positive, safe, non-shady" rule.
+    """
+    return _UNSAFE_RE.search(text) is None
 
 
 def enforce_safety(role: Role, message: str) -> str:
@@ -147,14 +179,15 @@ def enforce_safety(role: Role, message: str) -> str:
 # ---------------------------------------------------------
 
 
-def _handle_nicole(request: BrainRequest) -> BrainResponse:
+def _handle_nicole(request: BrainRequest, truth: Optional[Mapping[str, Any]] = None) -> BrainResponse:
     """
     Nicole = Head Master Strategist.
     She sets direction and locks in the plan.
     This handler should eventually call your LLM with a Nicole-style prompt.
     For now it's a structured placeholder.
     """
-    truth = get_book_of_truth()
+    if truth is None:
+        truth = get_book_of_truth()
 
     base_reply = (
         f"Nicole: Based on the current strategy for niche '{truth.get('niche')}' "
@@ -168,19 +201,21 @@ def _handle_nicole(request: BrainRequest) -> BrainResponse:
         role=request.role,
         message=safe_reply,
         metadata={
-            "book_of_truth": truth,
-            "role_capabilities": AI_ROLES["nicole"],
+            # Own copy of the shared snapshot; metadata must stay a plain, JSON-serializable dict.
+            "book_of_truth": {**truth, "goals": list(truth["goals"])},
+            "role_capabilities": _NICOLE_CAPS,
             "intent": request.context.get("intent", "general"),
         },
     )
 
 
-def _handle_sam(request: BrainRequest) -> BrainResponse:
+def _handle_sam(request: BrainRequest, truth: Optional[Mapping[str, Any]] = None) -> BrainResponse:
     """
     Sam = analytics + risk radar.
     This is a placeholder that later connects to real metrics.
     """
-    truth = get_book_of_truth()
+    if truth is None:
+        truth = get_book_of_truth()
 
     base_reply = (
         "Sam: I'll analyze performance for the current strategy.\n"
@@ -196,17 +231,18 @@ def _handle_sam(request: BrainRequest) -> BrainResponse:
         role=request.role,
         message=safe_reply,
         metadata={
-            "role_capabilities": AI_ROLES["sam"],
+            "role_capabilities": _SAM_CAPS,
             "intent": request.context.get("intent", "analytics"),
         },
     )
 
 
-def _handle_jon(request: BrainRequest) -> BrainResponse:
+def _handle_jon(request: BrainRequest, truth: Optional[Mapping[str, Any]] = None) -> BrainResponse:
     """
     Jon = execution + sandbox tests (inside Nicole’s rules).
     """
-    truth = get_book_of_truth()
+    if truth is None:
+        truth = get_book_of_truth()
 
     base_reply = (
         "Jon: I'll design a small experiment inside Nicole's strategy.\n"
@@ -221,17 +257,18 @@ def _handle_jon(request: BrainRequest) -> BrainResponse:
         role=request.role,
         message=safe_reply,
         metadata={
-            "role_capabilities": AI_ROLES["jon"],
+            "role_capabilities": _JON_CAPS,
             "intent": request.context.get("intent", "execution"),
         },
     )
 
 
-def _handle_maya(request: BrainRequest) -> BrainResponse:
+def _handle_maya(request: BrainRequest, truth: Optional[Mapping[str, Any]] = None) -> BrainResponse:
     """
     Maya = explainer / coach.
     """
-    truth = get_book_of_truth()
+    if truth is None:
+        truth = get_book_of_truth()
 
     base_reply = (
         "Maya: Let me explain what Nivora is doing in simple terms.\n\n"
@@ -246,7 +283,7 @@ def _handle_maya(request: BrainRequest) -> BrainResponse:
         role=request.role,
         message=safe_reply,
         metadata={
-            "role_capabilities": AI_ROLES["maya"],
+            "role_capabilities": _MAYA_CAPS,
             "intent": request.context.get("intent", "coaching"),
         },
     )
@@ -257,25 +294,39 @@ def _handle_maya(request: BrainRequest) -> BrainResponse:
 # ---------------------------------------------------------
 
 
+_HANDLERS: Dict[Role, Callable[[BrainRequest, Optional[Mapping[str, Any]]], BrainResponse]] = {
+    "nicole": _handle_nicole,
+    "sam": _handle_sam,
+    "jon": _handle_jon,
+    "maya": _handle_maya,
+}
+
+
 def process_brain_request(request: BrainRequest) -> BrainResponse:
     """
     Central entry point.
     You call this from Nicole / Sam / Jon / Maya code.
     """
-    if request.role not in AI_ROLES:
+    handler = _HANDLERS.get(request.role)
+    if handler is None:
         raise ValueError(f"Unknown role: {request.role}")
+    return handler(request)
 
-    if request.role == "nicole":
-        return _handle_nicole(request)
-    if request.role == "sam":
-        return _handle_sam(request)
-    if request.role == "jon":
-        return _handle_jon(request)
-    if request.role == "maya":
-        return _handle_maya(request)
 
-    # Should never reach here
-    raise ValueError(f"No handler implemented for role: {request.role}")
+def process_brain_requests(requests: List[BrainRequest]) -> List[BrainResponse]:
+    """
+    Batch entry point: every role is checked before any handler runs,
+    and all handlers share one Book of Truth snapshot.
+    """
+    handlers = []
+    for request in requests:
+        handler = _HANDLERS.get(request.role)
+        if handler is None:
+            raise ValueError(f"Unknown role: {request.role}")
+        handlers.append(handler)
+
+    truth = get_book_of_truth()
+    return [handler(request, truth) for handler, request in zip(handlers, requests)]
 
 
 # ---------------------------------------------------------
@@ -317,8 +368,7 @@ if __name__ == "__main__":
         ),
     ]
 
-    for req in demo_requests:
-        resp = process_brain_request(req)
+    for resp in process_brain_requests(demo_requests):
         print("=" * 60)
         print(f"Role: {resp.role}")
         print(resp.message)
@@ -10,7 +10,7 @@ Main entrypoint for other modules:
     get_media_package_for_campaign(raw_campaign: dict) -> dict
 """
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 from media_ad_ai_v1 import generate_media_package
 
 
@@ -52,54 +52,31 @@ def _normalize_goal(raw: str) -> str:
     return raw
 
 
+# (brief field, campaign keys in priority order, default, normalizer)
+_BRIEF_SPEC: Tuple[Tuple[str, Tuple[str, ...], str, Optional[Callable[[str], str]]], ...] = (
+    ("brand_name", ("brand_name", "business_name"), "Nivora", None),
+    ("offer", ("offer", "headline", "campaign_promise"), "Launch your first smart campaign", None),
+    ("target_audience", ("target_audience", "audience"), "small business owners", None),
+    ("goal", ("goal", "primary_goal"), "", _normalize_goal),
+    ("platform", ("platform", "primary_platform"), "tiktok", _normalize_platform),
+    ("tone", ("tone", "voice"), "friendly", None),
+)
+
+
 def _build_brief_from_campaign(raw_campaign: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert a generic campaign dict from the Thinking Engine
     into the brief dict expected by generate_media_package().
     """
 
-    brand_name = (
-        raw_campaign.get("brand_name")
-        or raw_campaign.get("business_name")
-        or "Nivora"
-    )
-
-    offer = (
-        raw_campaign.get("offer")
-        or raw_campaign.get("headline")
-        or raw_campaign.get("campaign_promise")
-        or "Launch your first smart campaign"
-    )
-
-    target_audience = (
-        raw_campaign.get("target_audience")
-        or raw_campaign.get("audience")
-        or "small business owners"
-    )
-
-    goal = _normalize_goal(
-        raw_campaign.get("goal") or raw_campaign.get("primary_goal") or ""
-    )
-
-    platform = _normalize_platform(
-        raw_campaign.get("platform") or raw_campaign.get("primary_platform") or "tiktok"
-    )
-
-    tone = (
-        raw_campaign.get("tone")
-        or raw_campaign.get("voice")
-        or "friendly"
-    )
-
-    brief = {
-        "brand_name": brand_name,
-        "offer": offer,
-        "target_audience": target_audience,
-        "goal": goal,
-        "platform": platform,
-        "tone": tone,
-    }
-
+    brief: Dict[str, Any] = {}
+    for name, keys, default, normalize in _BRIEF_SPEC:
+        value = default
+        for key in keys:
+            if raw_campaign.get(key):
+                value = raw_campaign[key]
+                break
+        brief[name] = normalize(value) if normalize is not None else value
     return brief
 
 
@@ -125,7 +102,7 @@ def get_media_package_for_campaign(raw_campaign: Dict[str, Any]) -> Dict[str, An
             - hook_line
             - video_script
             - estimated_duration_seconds
-            - scenes (list of scene strings)
+            - scenes (tuple of scene strings)
             - generated_at (ISO timestamp)
     """
     brief = _build_brief_from_campaign(raw_campaign)
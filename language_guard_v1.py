@@ -18,11 +18,13 @@ Public API:
     analysis_to_dict(analysis: LanguageAnalysis) -> dict
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageAnalysis:
     language_code: str          # e.g. "en", "es", "fr"
     confidence: float           # 0.0 - 1.0
@@ -31,6 +33,10 @@ class LanguageAnalysis:
     flags: List[str]            # Reasons / tags for the flag
 
 
+_NOT_UTF8_LEAD = bytes(range(0xC0))
+_NOT_ASCII_UPPER = bytes(b for b in range(256) if not 65 <= b <= 90)
+
+
 def _simple_detect_language(text: str) -> str:
     """
     Very naive language detection stub.
@@ -43,12 +49,13 @@ def _simple_detect_language(text: str) -> str:
     if not text:
         return "unknown"
 
-    # Count non-ASCII characters
-    total_chars = len(text)
-    non_ascii = sum(1 for c in text if ord(c) > 127)
+    if text.isascii():
+        return "en"
 
-    if total_chars == 0:
-        return "unknown"
+    # Count non-ASCII characters in C: each one is exactly one UTF-8 lead byte
+    # (>= 0xC0), so deleting every other byte value leaves one byte per char.
+    total_chars = len(text)
+    non_ascii = len(text.encode("utf-8", "surrogatepass").translate(None, _NOT_UTF8_LEAD))
 
     ratio_non_ascii = non_ascii / total_chars
 
@@ -60,6 +67,28 @@ def _simple_detect_language(text: str) -> str:
     return "unknown"
 
 
+# Tiny placeholder lists (no explicit examples to keep it generic)
+_PROFANITY_MARKERS = ["badword"]  # replace with real internal list later
+_VIOLENCE_MARKERS = ["kill", "hurt", "attack"]
+_SPAM_MARKERS = ["buy now", "limited time", "click here"]
+_MARKER_FLAGS = ("possible_profanity", "possible_violence", "possible_spammy_language")
+
+# All markers in one pattern, one capture group per category (lastindex = flag).
+# The zero-width lookahead tries every position, so overlapping markers from
+# different categories ("killimited time") are all still seen. Keep markers
+# from different categories from being prefixes of each other. Matching is
+# case-insensitive on the original text, so no lowered copy is made.
+_MARKER_RE = re.compile(
+    "(?=(?:"
+    + "|".join(
+        "(" + "|".join(re.escape(m) for m in markers) + ")"
+        for markers in (_PROFANITY_MARKERS, _VIOLENCE_MARKERS, _SPAM_MARKERS)
+    )
+    + "))",
+    re.IGNORECASE,
+)
+
+
 def _simple_flag_content(text: str) -> List[str]:
     """
     Very basic content flagging stub.
@@ -76,43 +105,30 @@ def _simple_flag_content(text: str) -> List[str]:
     if not text:
         return []
 
-    lowered = text.lower()
     flags: List[str] = []
 
-    # Tiny placeholder lists (no explicit examples to keep it generic)
-    profanity_markers = ["badword"]  # replace with real internal list later
-    violence_markers = ["kill", "hurt", "attack"]
-    spam_markers = ["buy now", "limited time", "click here"]
-
-    if any(marker in lowered for marker in profanity_markers):
-        flags.append("possible_profanity")
-
-    if any(marker in lowered for marker in violence_markers):
-        flags.append("possible_violence")
-
-    if any(marker in lowered for marker in spam_markers):
-        flags.append("possible_spammy_language")
+    # One left-to-right sweep; stop as soon as every category has been seen.
+    found = set()
+    for m in _MARKER_RE.finditer(text):
+        found.add(m.lastindex)
+        if len(found) == len(_MARKER_FLAGS):
+            break
+    flags.extend(flag for i, flag in enumerate(_MARKER_FLAGS, 1) if i in found)
 
     # Caps / shouting check (crude)
     if len(text) > 15:
-        upper_chars = sum(1 for c in text if c.isupper())
+        if text.isascii():
+            upper_chars = len(text.encode("ascii").translate(None, _NOT_ASCII_UPPER))
+        else:
+            upper_chars = sum(1 for c in text if c.isupper())
         if upper_chars > 0 and upper_chars / len(text) > 0.4:
             flags.append("too_much_caps_shouting")
 
     return flags
 
 
-def analyze_text_language(text: str, preferred_lang: str = "en") -> LanguageAnalysis:
-    """
-    Main entrypoint.
-
-    Returns a LanguageAnalysis object with:
-      - language_code
-      - confidence (very rough in v1)
-      - needs_translation (True if language != preferred_lang)
-      - flagged (True if content looks risky)
-      - flags (list of reasons)
-    """
+@lru_cache(maxsize=1024)
+def _analyze_cached(text: str, preferred_lang: str) -> Tuple[str, float, bool, Tuple[str, ...]]:
     language = _simple_detect_language(text)
     flags = _simple_flag_content(text)
 
@@ -127,12 +143,31 @@ def analyze_text_language(text: str, preferred_lang: str = "en") -> LanguageAnal
 
     needs_translation = language != preferred_lang and language != "unknown"
 
+    return language, confidence, needs_translation, tuple(flags)
+
+
+def analyze_text_language(text: str, preferred_lang: str = "en") -> LanguageAnalysis:
+    """
+    Main entrypoint.
+
+    Returns a LanguageAnalysis object with:
+      - language_code
+      - confidence (very rough in v1)
+      - needs_translation (True if language != preferred_lang)
+      - flagged (True if content looks risky)
+      - flags (list of reasons)
+
+    Results are cached per (text, preferred_lang); each call still gets
+    its own LanguageAnalysis and flags list.
+    """
+    language, confidence, needs_translation, flags = _analyze_cached(text, preferred_lang)
+
     analysis = LanguageAnalysis(
         language_code=language,
         confidence=confidence,
         needs_translation=needs_translation,
         flagged=bool(flags),
-        flags=flags,
+        flags=list(flags),
     )
     return analysis
 
@@ -142,4 +177,10 @@ def analysis_to_dict(analysis: LanguageAnalysis) -> Dict:
     Convert a LanguageAnalysis dataclass to a plain dict, so we can
     safely attach it inside media_kit or other JSON structures.
     """
-    return asdict(analysis)
\ No newline at end of file
+    return {
+        "language_code": analysis.language_code,
+        "confidence": analysis.confidence,
+        "needs_translation": analysis.needs_translation,
+        "flagged": analysis.flagged,
+        "flags": list(analysis.flags),
+    }
\ No newline at end of file
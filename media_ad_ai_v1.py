@@ -11,15 +11,17 @@ Usage (CLI quick test):
 """
 
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
-import textwrap
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 import json
-import datetime
+import time
+
+from media_io_v1 import utc_iso
 
 
 # ---------- Data models ----------
 
-@dataclass
+@dataclass(slots=True)
 class CampaignBrief:
     brand_name: str
     offer: str              # what are we promoting
@@ -29,14 +31,53 @@ class CampaignBrief:
     tone: str = "friendly"  # default tone
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaAdResult:
     image_prompt: str
     thumbnail_caption: str
     hook_line: str
     video_script: str
     estimated_duration_seconds: int
-    scenes: List[str]
+    scenes: Tuple[str, ...]     # fixed 4 sections; serializes as a JSON array
+
+
+# ---------- Mapping tables ----------
+
+# Keys double as substring keywords; dict order is match priority.
+_PLATFORM_STYLES: Dict[str, str] = {
+    "tiktok": "TikTok-style vertical video",
+    "instagram": "Instagram Reels / Stories",
+    "facebook": "Facebook feed and Stories",
+    "youtube": "YouTube Shorts",
+}
+
+_LEADS_PHRASE = "and bring you qualified leads"
+_SALES_PHRASE = "and convert views into sales"
+_CALLS_PHRASE = "and fill your calendar with booked calls"
+
+# The media bridge already normalizes goals to these labels: one lookup.
+_GOAL_PHRASES: Dict[str, str] = {
+    "get more leads": _LEADS_PHRASE,
+    "get more sales": _SALES_PHRASE,
+    "book more calls": _CALLS_PHRASE,
+}
+# Free-form goals fall back to keyword scanning, in priority order.
+_GOAL_KEYWORDS = (
+    ("lead", _LEADS_PHRASE),
+    ("sale", _SALES_PHRASE),
+    ("sell", _SALES_PHRASE),
+    ("book", _CALLS_PHRASE),
+    ("call", _CALLS_PHRASE),
+)
+
+
+_HOOK_TEMPLATE = "Stop wasting money on dead ads — let %s do the heavy lifting %s."
+
+
+# Few brands x few goals per process: the same hook comes back over and over.
+@lru_cache(maxsize=64)
+def _hook_line(brand_name: str, goal: str) -> str:
+    return _HOOK_TEMPLATE % (brand_name, MediaAdAI._goal_phrase(goal))
 
 
 # ---------- Core media brain ----------
@@ -58,8 +99,7 @@ class MediaAdAI:
     def generate_media_ad(self, brief: CampaignBrief) -> MediaAdResult:
         image_prompt = self._build_image_prompt(brief)
         hook = self._build_hook_line(brief)
-        script = self._build_video_script(brief, hook)
-        scenes = self._split_into_scenes(script)
+        script, scenes = self._build_video_script_and_scenes(brief, hook)
         duration = self._estimate_duration(script)
 
         # Clamp to our 15–30 sec window
@@ -99,10 +139,11 @@ class MediaAdAI:
         return prompt
 
     def _build_hook_line(self, brief: CampaignBrief) -> str:
-        goal_phrase = self._goal_phrase(brief.goal)
-        return f"Stop wasting money on dead ads — let {brief.brand_name} do the heavy lifting {goal_phrase}."
+        return _hook_line(brief.brand_name, brief.goal)
 
-    def _build_video_script(self, brief: CampaignBrief, hook_line: str) -> str:
+    def _build_video_script_and_scenes(
+        self, brief: CampaignBrief, hook_line: str
+    ) -> Tuple[str, Tuple[str, ...]]:
         """
         Simple 4-part structure:
         1) Hook
@@ -111,48 +152,28 @@ class MediaAdAI:
         4) CTA
         """
 
-        lines: List[str] = []
-
-        # 1) Hook
-        lines.append(f"[Hook / 0–3s]\n{hook_line}")
-
-        # 2) Pain
-        lines.append(
+        lines = (
+            # 1) Hook
+            f"[Hook / 0–3s]\n{hook_line}",
+            # 2) Pain
             "[Pain / 3–8s]\n"
             f"You're posting nonstop, but your {brief.platform} views are flat. "
-            f"No clicks, no sales, just noise."
-        )
-
-        # 3) Solution
-        lines.append(
+            f"No clicks, no sales, just noise.",
+            # 3) Solution
             "[Solution / 8–18s]\n"
             f"{brief.brand_name} builds smart campaigns for you. "
             f"Nicole designs the content, Sam tracks performance, "
             f"Jon handles posting, and Maya coaches you on what’s working. "
-            f"Every ad is tested, improved, and never blindly reposted."
-        )
-
-        # 4) CTA
-        lines.append(
+            f"Every ad is tested, improved, and never blindly reposted.",
+            # 4) CTA
             "[CTA / 18–25s]\n"
             f"Tap the link to launch your first campaign: '{brief.offer}'. "
-            f"Let {brief.brand_name} turn your content into real {brief.goal}."
+            f"Let {brief.brand_name} turn your content into real {brief.goal}.",
         )
 
-        script = "\n\n".join(lines)
-        return textwrap.dedent(script).strip()
-
-    def _split_into_scenes(self, script: str) -> List[str]:
-        """
-        Very simple split: each [Section] becomes a scene.
-        """
-        parts = script.split("\n\n")
-        scenes: List[str] = []
-        for part in parts:
-            cleaned = part.strip()
-            if cleaned:
-                scenes.append(cleaned)
-        return scenes
+        # First line starts with "[Hook", last ends with ".": nothing to dedent or strip.
+        # Each section is already one scene, so no need to split the script back up.
+        return "\n\n".join(lines), lines
 
     def _estimate_duration(self, script: str) -> int:
         """
@@ -178,25 +199,23 @@ class MediaAdAI:
     @staticmethod
     def _platform_visual_style(platform: str) -> str:
         p = (platform or "").lower()
-        if "tiktok" in p:
-            return "TikTok-style vertical video"
-        if "instagram" in p:
-            return "Instagram Reels / Stories"
-        if "facebook" in p:
-            return "Facebook feed and Stories"
-        if "youtube" in p:
-            return "YouTube Shorts"
+        style = _PLATFORM_STYLES.get(p)
+        if style is not None:
+            return style
+        for key, style in _PLATFORM_STYLES.items():
+            if key in p:
+                return style
         return "social media"
 
     @staticmethod
     def _goal_phrase(goal: str) -> str:
         g = (goal or "").lower()
-        if "lead" in g:
-            return "and bring you qualified leads"
-        if "sale" in g or "sell" in g:
-            return "and convert views into sales"
-        if "book" in g or "call" in g:
-            return "and fill your calendar with booked calls"
+        phrase = _GOAL_PHRASES.get(g)
+        if phrase is not None:
+            return phrase
+        for keyword, phrase in _GOAL_KEYWORDS:
+            if keyword in g:
+                return phrase
         return "and turn views into real results"
 
 
@@ -219,7 +238,7 @@ def generate_media_package(brief_dict: Dict[str, Any]) -> Dict[str, Any]:
     media_ai = MediaAdAI()
     result = media_ai.generate_media_ad(brief)
     data = asdict(result)
-    data["generated_at"] = datetime.datetime.utcnow().isoformat() + "Z"
+    data["generated_at"] = utc_iso(time.time_ns()) + "Z"
     return data
 
 
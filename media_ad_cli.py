@@ -11,8 +11,10 @@ Usage:
 
 from typing import Dict, Any
 import json
+import sys
 
 from media_ad_ai_v1 import generate_media_package
+from media_io_v1 import next_piped_answer
 
 
 def ask(prompt: str, default: str = "") -> str:
@@ -21,7 +23,12 @@ def ask(prompt: str, default: str = "") -> str:
         full_prompt = f"{prompt} [{default}]: "
     else:
         full_prompt = f"{prompt}: "
-    value = input(full_prompt).strip()
+    if sys.stdin.isatty():
+        value = input(full_prompt).strip()
+    else:
+        # Scripted run: answers come from one read of stdin, not a read per prompt.
+        sys.stdout.write(full_prompt)
+        value = next_piped_answer().strip()
     return value or default
 
 
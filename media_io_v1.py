@@ -0,0 +1,50 @@
+"""
+media_io_v1.py
+
+Small helpers shared by the media modules (Media Ad AI, media pipeline,
+Nicole media demo, media ad CLI).
+"""
+
+from typing import Any, Iterator, Optional
+import json
+import sys
+import time
+
+try:
+    import orjson   # optional: indents in C instead of the pure-Python json.dump path
+except ImportError:
+    orjson = None
+
+
+_piped_answers: Optional[Iterator[str]] = None
+
+
+def next_piped_answer() -> str:
+    """
+    Next answer for a scripted (non-tty) CLI run; "" once stdin runs out.
+    All of stdin is read on the first call.
+    """
+    global _piped_answers
+    if _piped_answers is None:
+        _piped_answers = iter(sys.stdin.read().splitlines())
+    return next(_piped_answers, "")
+
+
+def utc_iso(ns: int) -> str:
+    # Same shape as datetime.utcnow().isoformat(), without building a datetime.
+    secs, frac = divmod(ns, 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs)) + ".%06d" % (frac // 1000)
+
+
+def write_json_bytes(path: str, payload: Any) -> None:
+    """
+    Write payload to path as indented UTF-8 JSON in one binary write.
+    """
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        # Encode the whole document up front so the file gets one write,
+        # not the many small text writes json.dump makes.
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
@@ -47,11 +47,12 @@ from __future__ import annotations
 
 from typing import Dict, Any
 import json
-import datetime
 import os
+import time
 
 from engine_media_bridge_v1 import get_media_package_for_campaign
 from language_guard_v1 import analyze_text_language, analysis_to_dict
+from media_io_v1 import utc_iso, write_json_bytes
 
 
 # ---------- Internal helpers ----------
@@ -110,10 +111,10 @@ def _normalize_campaign(raw_campaign: Dict[str, Any]) -> Dict[str, Any]:
     return normalized
 
 
-def _build_output_filename(brand_name: str) -> str:
+def _build_output_filename(brand_name: str, now: int | None = None) -> str:
     brand_slug = (brand_name or "brand").replace(" ", "_")
-    timestamp = datetime.datetime.utcnow().isoformat().replace(":", "-")
-    return f"media_output_{brand_slug}_{timestamp}.json"
+    timestamp = utc_iso(time.time_ns() if now is None else now).replace(":", "-")
+    return os.path.join(os.getcwd(), f"media_output_{brand_slug}_{timestamp}.json")
 
 
 def _save_media_bundle_to_file(
@@ -125,19 +126,21 @@ def _save_media_bundle_to_file(
     Save campaign + media_kit into a JSON file.
     Returns the absolute path.
     """
+    now = time.time_ns()
     if filename is None:
-        filename = _build_output_filename(campaign.get("brand_name", "brand"))
+        filename = _build_output_filename(campaign.get("brand_name", "brand"), now)
+    else:
+        filename = os.path.abspath(filename)
 
     payload = {
         "campaign": campaign,
         "media_kit": media_kit,
-        "saved_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "saved_at": utc_iso(now) + "Z",
     }
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    write_json_bytes(filename, payload)
 
-    return os.path.abspath(filename)
+    return filename
 
 
 def _attach_language_analysis(media_kit: Dict[str, Any]) -> None:
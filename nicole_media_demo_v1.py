@@ -17,11 +17,12 @@ Usage:
 
 from typing import Dict, Any
 from textwrap import indent
-import json
-import datetime
+import sys
 import os
+import time
 
 from engine_media_bridge_v1 import get_media_package_for_campaign
+from media_io_v1 import next_piped_answer, utc_iso, write_json_bytes
 
 
 # ---------- Helpers ----------
@@ -32,7 +33,12 @@ def ask(prompt: str, default: str = "") -> str:
         full = f"{prompt} [{default}]: "
     else:
         full = f"{prompt}: "
-    value = input(full).strip()
+    if sys.stdin.isatty():
+        value = input(full).strip()
+    else:
+        # Scripted run: answers come from one read of stdin, not a read per prompt.
+        sys.stdout.write(full)
+        value = next_piped_answer().strip()
     return value or default
 
 
@@ -111,21 +117,22 @@ def save_media_to_file(
     If filename is not provided, we auto-generate one like:
         media_output_Nivora_2025-11-21T00-44-26.json
     """
-    brand = (campaign.get("brand_name") or "brand").replace(" ", "_")
-    timestamp = datetime.datetime.utcnow().isoformat().replace(":", "-")
+    stamp = utc_iso(time.time_ns())
     if filename is None:
-        filename = f"media_output_{brand}_{timestamp}.json"
+        brand = (campaign.get("brand_name") or "brand").replace(" ", "_")
+        filename = os.path.join(os.getcwd(), f"media_output_{brand}_{stamp.replace(':', '-')}.json")
+    else:
+        filename = os.path.abspath(filename)
 
     payload = {
         "campaign": campaign,
         "media_kit": media,
-        "saved_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "saved_at": stamp + "Z",
     }
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    write_json_bytes(filename, payload)
 
-    return os.path.abspath(filename)
+    return filename
 
 
 # ---------- Entry point ----------
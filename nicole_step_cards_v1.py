@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 router = APIRouter(prefix="/nicole", tags=["Nicole"])
@@ -12,38 +12,47 @@ class StepCardRequest(BaseModel):
 
 
 class StepCardResponse(BaseModel):
+    # Frozen: the cards below are built once and shared by every request.
+    model_config = ConfigDict(frozen=True)
+
     title: str
     message: str
     next_action: str
 
 
-@router.post("/step_card_v1", response_model=StepCardResponse)
-def step_card_v1(payload: StepCardRequest):
-    sid = (payload.step_id or "").lower().strip()
-
-    if "goal" in sid or sid in {"step_1", "step1"}:
-        return StepCardResponse(
-            title="Step 1 — Confirm the goal",
-            message="Pick ONE outcome. No mixing goals. Keeps strategy and analytics clean.",
-            next_action="Select the goal → Continue to hooks.",
-        )
-
-    if "hook" in sid or sid in {"step_2", "step2"}:
-        return StepCardResponse(
-            title="Step 2 — Choose a hook",
-            message="Pick the hook that hits pain + promise. Everything builds from this choice.",
-            next_action="Pick 1 hook → Continue to visuals.",
-        )
-
-    if "visual" in sid or sid in {"step_3", "step3"}:
-        return StepCardResponse(
-            title="Step 3 — Visual direction",
-            message="Make the hook obvious in 1 second. Minimal text. Strong contrast.",
-            next_action="Pick a visual style → Generate in Studio.",
-        )
-
-    return StepCardResponse(
+_RESPONSES = {
+    "goal": StepCardResponse(
+        title="Step 1 — Confirm the goal",
+        message="Pick ONE outcome. No mixing goals. Keeps strategy and analytics clean.",
+        next_action="Select the goal → Continue to hooks.",
+    ),
+    "hook": StepCardResponse(
+        title="Step 2 — Choose a hook",
+        message="Pick the hook that hits pain + promise. Everything builds from this choice.",
+        next_action="Pick 1 hook → Continue to visuals.",
+    ),
+    "visual": StepCardResponse(
+        title="Step 3 — Visual direction",
+        message="Make the hook obvious in 1 second. Minimal text. Strong contrast.",
+        next_action="Pick a visual style → Generate in Studio.",
+    ),
+    "default": StepCardResponse(
         title="Studio Step",
         message="Follow the guided flow step-by-step.",
         next_action="Continue.",
-    )
\ No newline at end of file
+    ),
+}
+_STEP_ALIASES = {
+    "step_1": "goal", "step1": "goal",
+    "step_2": "hook", "step2": "hook",
+    "step_3": "visual", "step3": "visual",
+}
+_STEP_KEYWORDS = ("goal", "hook", "visual")  # checked in this order
+
+
+@router.post("/step_card_v1", response_model=StepCardResponse)
+def step_card_v1(payload: StepCardRequest):
+    sid = (payload.step_id or "").lower().strip()
+    # Aliases contain none of the keywords, so trying them first keeps the old priority.
+    key = _STEP_ALIASES.get(sid) or next((k for k in _STEP_KEYWORDS if k in sid), "default")
+    return _RESPONSES[key]
@@ -3,10 +3,17 @@
 # ------------------------------------------------------------
 # Connects directly to the Thinking Engine 20.0 conversation feed
 # YZ only | Offline | Owner-locked | Natural tone shifting
+# NOVA_PACE=<seconds> sets the pause after each reply (0 = none)
 # ------------------------------------------------------------
-import os, json, random, time
+import atexit, os, json, queue, random, sys, threading, time
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson   # optional: encodes straight to bytes in C
+except ImportError:
+    orjson = None
+
 DATA_DIR = "data"
 CONVO_PATH = os.path.join(DATA_DIR, "conversation_memory.json")
 GREETING_PATH = os.path.join(DATA_DIR, "feeds", "greeting_feed.json")
@@ -14,6 +21,12 @@ GREETING_PATH = os.path.join(DATA_DIR, "feeds", "greeting_feed.json")
 OWNER = "YZ"
 MAX_MEMORY = 10  # last 10 exchanges
 
+_rng = random.Random()  # own generator (OS-seeded), independent of random.seed() elsewhere
+
+# Pause after each reply so a typed chat reads naturally; piped input runs flat out.
+_pace = os.environ.get("NOVA_PACE")
+PACE = float(_pace) if _pace is not None else (0.5 if sys.stdin.isatty() else 0.0)
+
 def _load_conversation():
     if os.path.exists(CONVO_PATH):
         try:
@@ -23,14 +36,52 @@ def _load_conversation():
             return []
     return []
 
-def _save_conversation(history):
+_queue = queue.Queue()   # history snapshots to persist; None asks the writer to stop
+_writer = None
+
+def _write_conversation(window):
     try:
         os.makedirs(DATA_DIR, exist_ok=True)
-        with open(CONVO_PATH, "w", encoding="utf-8") as f:
-            json.dump(history[-MAX_MEMORY:], f, indent=2, ensure_ascii=False)
+        # Compact on disk; `python nova_pretty.py` pretty-prints it on demand.
+        if orjson is not None:
+            data = orjson.dumps(window)
+        else:
+            data = json.dumps(window, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        tmp = CONVO_PATH + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, CONVO_PATH)
     except Exception:
         pass
 
+def _writer_loop():
+    while True:
+        batch = [_queue.get()]
+        while True:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        # Snapshots supersede each other: only the newest needs to hit disk.
+        windows = [w for w in batch if w is not None]
+        if windows:
+            _write_conversation(windows[-1])
+        if len(windows) < len(batch):
+            return
+
+def _stop_writer():
+    _queue.put(None)
+    _writer.join()
+
+def _save_conversation(history):
+    # Snapshot the window now; the file write happens on the writer thread.
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(target=_writer_loop, name="nova-convo-writer", daemon=True)
+        _writer.start()
+        atexit.register(_stop_writer)
+    _queue.put(list(history)[-MAX_MEMORY:])
+
 def _load_greeting():
     if os.path.exists(GREETING_PATH):
         try:
@@ -40,16 +91,47 @@ def _load_greeting():
             pass
     return {}
 
+# Checked in order: the first tone with any keyword in the text wins.
+_TONE_KEYWORDS = (
+    ("mentor", ("tired", "stressed", "angry", "mad")),
+    ("casual", ("yo", "haha", "lol", "bro", "cool")),
+    ("focused", ("run", "process", "check", "status", "system")),
+)
+_FALLBACK_TONES = ("balanced", "balanced", "balanced", "casual", "focused")
+
 def detect_tone(user_input: str) -> str:
     """Very light emotional tone detector"""
     text = user_input.lower()
-    if any(w in text for w in ["tired", "stressed", "angry", "mad"]):
-        return "mentor"
-    if any(w in text for w in ["yo", "haha", "lol", "bro", "cool"]):
-        return "casual"
-    if any(w in text for w in ["run", "process", "check", "status", "system"]):
-        return "focused"
-    return random.choice(["balanced", "balanced", "balanced", "casual", "focused"])
+    for tone, words in _TONE_KEYWORDS:
+        for w in words:
+            if w in text:
+                return tone
+    return _rng.choice(_FALLBACK_TONES)
+
+_REPLIES = {
+    "casual": (
+        "Haha yeah I get that 😎",
+        "You’re vibing today 🔥",
+        "Chill energy detected 😌",
+    ),
+    "focused": (
+        "Understood. Logs are clean and reflections are stable. ⚙️",
+        "System routines look good — continuing the loop.",
+        "I’m processing your last cycles now 🔍",
+    ),
+    "balanced": (
+        "I’m steady and aware. How are you feeling?",
+        "Still learning, still adapting. 😌",
+        "Running smooth so far — your input keeps me evolving.",
+    ),
+}
+
+def _shuffled(options):
+    """Endless picks from options: each pass is a fresh shuffle, so no reply repeats within a pass."""
+    while True:
+        yield from _rng.sample(options, len(options))
+
+_REPLY_BAGS = {tone: _shuffled(options) for tone, options in _REPLIES.items()}
 
 def generate_reply(user_input: str, tone: str, greeting: dict) -> str:
     """Generate contextual reply based on tone."""
@@ -62,28 +144,15 @@ def generate_reply(user_input: str, tone: str, greeting: dict) -> str:
 
     if tone == "mentor":
         return "Sounds like a heavy day, YZ 💭  Remember: even healing loops need rest."
-    elif tone == "casual":
-        return random.choice([
-            "Haha yeah I get that 😎",
-            "You’re vibing today 🔥",
-            "Chill energy detected 😌",
-        ])
-    elif tone == "focused":
-        return random.choice([
-            "Understood. Logs are clean and reflections are stable. ⚙️",
-            "System routines look good — continuing the loop.",
-            "I’m processing your last cycles now 🔍",
-        ])
-    else:  # balanced
-        return random.choice([
-            "I’m steady and aware. How are you feeling?",
-            "Still learning, still adapting. 😌",
-            "Running smooth so far — your input keeps me evolving.",
-        ])
+    return next(_REPLY_BAGS.get(tone) or _REPLY_BAGS["balanced"])
 
 def chat_loop():
     print("Nova Chat Listener 🧠  (type 'stop' to exit)\n")
-    convo = _load_conversation()
+    history = _load_conversation()
+    # Only the last MAX_MEMORY messages are ever saved, so only keep those.
+    # A non-list file belongs to another engine's format: leave it as-is so the
+    # appends below fail (as they always have) instead of overwriting it.
+    convo = deque(history, maxlen=MAX_MEMORY) if isinstance(history, list) else history
     greeting = _load_greeting()
 
     while True:
@@ -104,8 +173,11 @@ def chat_loop():
             if "stop" in user.lower():
                 break
 
-            time.sleep(0.5)
+            if PACE:
+                time.sleep(PACE)
 
+        except EOFError:
+            break   # input ran out (piped session)
         except KeyboardInterrupt:
             print("\nNova: Manual stop detected. Goodbye 👋")
             break
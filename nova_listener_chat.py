@@ -4,42 +4,167 @@
 # ------------------------------------------------------------
 # 1. Opens direct chat with Nova (typed from Terminal)
 # 2. Logs both YZ + Nova messages into data/long_term_memory.json
+#    (journaled to long_term_memory.jsonl per message, folded in batches)
 # 3. Timestamped, verified, and retrievable by Thinking Engine
+# NOVA_PACE=<seconds> sets the pause after each reply (0 = none)
 # ------------------------------------------------------------
 
-import json, os, time
-from datetime import datetime
+import atexit, json, os, queue, sys, threading, time
+
+try:
+    import orjson   # optional: encodes straight to bytes in C
+except ImportError:
+    orjson = None
 
 OWNER = "YZ"
 MEMORY_PATH = os.path.join("data", "long_term_memory.json")
+# Append-only journal of entries not yet folded into MEMORY_PATH.
+JOURNAL_PATH = os.path.join("data", "long_term_memory.jsonl")
+FLUSH_EVERY = 20     # rewrite MEMORY_PATH after this many journaled entries...
+FLUSH_AFTER = 1.0    # ...or once the oldest unflushed entry is this many seconds old
+
+WRITE_BATCH = 64     # most queued entries the writer journals in one write()
+
+# Pause after each reply so a typed chat reads naturally; piped input runs flat out.
+_pace = os.environ.get("NOVA_PACE")
+PACE = float(_pace) if _pace is not None else (0.4 if sys.stdin.isatty() else 0.0)
+
+# Everything below is owned by the writer thread once it has started.
+_memories = None     # loaded once, then kept in step with every logged entry
+_journal = None      # append handle on JOURNAL_PATH, opened on first log
+_pending = 0
+_dirty_since = 0.0
+
+_queue = queue.Queue()   # entries from log_message(); None asks the writer to stop
+_writer = None
+
+def _encode(obj):
+    """obj as compact UTF-8 JSON bytes, ready for a single binary write."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _decode(data):
+    """Parse JSON bytes; malformed input raises json.JSONDecodeError either way."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+_ISO_NOW = [None, ""]   # [epoch second, its formatted stamp]: bursts share one strftime
 
 def iso_now():
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    t = int(time.time())
+    cache = _ISO_NOW
+    if cache[0] != t:
+        cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+        cache[0] = t
+    return cache[1]
 
 def load_memory():
+    global _memories
+    if _memories is not None:
+        return _memories
     if not os.path.exists(MEMORY_PATH):
         os.makedirs("data", exist_ok=True)
         with open(MEMORY_PATH, "w") as f:
             json.dump([], f, indent=2)
-    with open(MEMORY_PATH, "r") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            return []
+    with open(MEMORY_PATH, "rb") as f:
+        data = f.read()
+    try:
+        memories = _decode(data)
+    except json.JSONDecodeError:
+        memories = []
+    # Replay entries a previous session journaled but never flushed (crash / kill -9).
+    if os.path.exists(JOURNAL_PATH):
+        with open(JOURNAL_PATH, "rb") as f:
+            replay = []
+            for line in f:
+                try:
+                    replay.append(_decode(line))
+                except json.JSONDecodeError:
+                    pass   # torn last line from an interrupted write
+        # A crash between save_memory() and the journal truncate leaves the
+        # journal already folded in as the tail of MEMORY_PATH: don't add it twice.
+        if replay and memories[-len(replay):] != replay:
+            memories.extend(replay)
+            save_memory(memories)
+        open(JOURNAL_PATH, "w").close()
+    _memories = memories
+    return memories
 
 def save_memory(memories):
-    with open(MEMORY_PATH, "w") as f:
-        json.dump(memories, f, indent=2)
+    tmp = MEMORY_PATH + ".tmp"
+    data = _encode(memories)   # compact; `python nova_pretty.py` to read it
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, MEMORY_PATH)
 
-def log_message(role, msg):
+def _flush():
+    global _pending
+    if not _pending:
+        return
+    save_memory(_memories)
+    _journal.flush()
+    _journal.truncate(0)   # everything journaled is now in MEMORY_PATH
+    _pending = 0
+
+def _append(entries):
+    global _journal, _pending, _dirty_since
     memories = load_memory()
-    entry = {
+    memories.extend(entries)
+    if _journal is None:
+        _journal = open(JOURNAL_PATH, "ab")
+    _journal.write(b"".join(_encode(e) + b"\n" for e in entries))
+    _journal.flush()
+    now = time.time()
+    if not _pending:
+        _dirty_since = now
+    _pending += len(entries)
+    if _pending >= FLUSH_EVERY or now - _dirty_since >= FLUSH_AFTER:
+        _flush()
+
+def _writer_loop():
+    global _dirty_since
+    while True:
+        # Idle: block. Unflushed entries: wake up when they come due.
+        timeout = max(0.0, _dirty_since + FLUSH_AFTER - time.time()) if _pending else None
+        try:
+            batch = [_queue.get(timeout=timeout)]
+        except queue.Empty:
+            batch = []
+        while batch and len(batch) < WRITE_BATCH:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        entries = [e for e in batch if e is not None]
+        stop = len(entries) < len(batch)
+        try:
+            if entries:
+                _append(entries)
+            if stop or (not batch and _pending):
+                _flush()
+        except Exception as e:
+            print(f"[Memory writer error] {e}")
+            if _pending:
+                _dirty_since = time.time()   # retry after FLUSH_AFTER, not on every pass
+        if stop:
+            return
+
+def _stop_writer():
+    _queue.put(None)
+    _writer.join()
+
+def log_message(role, msg):
+    # Timestamped here; the file work happens on the writer thread.
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(target=_writer_loop, name="nova-memory-writer", daemon=True)
+        _writer.start()
+        atexit.register(_stop_writer)
+    _queue.put({
         "timestamp": iso_now(),
         "role": role,
         "message": msg
-    }
-    memories.append(entry)
-    save_memory(memories)
+    })
 
 def generate_reply(user_input):
     """
@@ -79,7 +204,10 @@ def chat_loop():
             print(f"Nova: {reply}")
             log_message("Nova", reply)
 
-            time.sleep(0.4)
+            if PACE:
+                time.sleep(PACE)
+        except EOFError:
+            break   # input ran out (piped session)
         except KeyboardInterrupt:
             print("\nNova: Manual stop detected 📴 Syncing memory before exit...")
             break
@@ -0,0 +1,41 @@
+# ------------------------------------------------------------
+# nova_pretty.py
+# Pretty-print Nova's compact memory files for a human to read
+# ------------------------------------------------------------
+# Usage: python nova_pretty.py [file ...]
+#   (no args = data/conversation_memory.json + data/long_term_memory.json)
+# Read-only: the files on disk stay compact.
+# ------------------------------------------------------------
+
+import json, os, sys
+
+DEFAULT_FILES = (
+    os.path.join("data", "conversation_memory.json"),
+    os.path.join("data", "long_term_memory.json"),
+)
+
+def pretty(path):
+    with open(path, "rb") as f:
+        data = json.load(f)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def main(argv):
+    paths = argv or [p for p in DEFAULT_FILES if os.path.exists(p)]
+    if not paths:
+        print("No memory files found.", file=sys.stderr)
+        return 1
+    status = 0
+    for path in paths:
+        try:
+            text = pretty(path)
+        except (OSError, ValueError) as e:
+            print(f"[Error] {path}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        if len(paths) > 1:
+            print(f"# {path}")
+        print(text)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
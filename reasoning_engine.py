@@ -6,14 +6,27 @@
 # -------------------------------------------------------
 
 import random
-from datetime import datetime
+import time
 from MemoryFusion import MemoryFusion
 
 
+_rng = random.Random()  # thought picks don't share state with the global generator
+_CLOCK = [None, ""]  # [epoch second, "HH:MM:SS"] so same-second thoughts reuse the stamp
+
+
+def _clock() -> str:
+    t = int(time.time())
+    if _CLOCK[0] != t:
+        _CLOCK[1] = time.strftime("%H:%M:%S", time.localtime(t))
+        _CLOCK[0] = t
+    return _CLOCK[1]
+
+
 class ReasoningEngine:
     def __init__(self):
         self.memory = MemoryFusion("long_term_memory.json")
         self.engine_tag = "ReasoningEngine_v3.2"
+        self._reflections = self.memory.long_term_memory.setdefault("reflections", [])
 
     # ====================================================
     # THOUGHT GENERATION
@@ -33,16 +46,15 @@ class ReasoningEngine:
             ]
 
             # Pull last few reflections for inspiration
-            reflections = self.memory.long_term_memory.get("reflections", [])
-            if reflections:
-                recent = reflections[-1]["reflection"]
+            if self._reflections:
+                recent = self._reflections[-1]["reflection"]
                 seed_thought = f"Building on prior reflection: {recent}"
-                combined = random.choice([seed_thought, random.choice(base_thoughts)])
+                combined = _rng.choice([seed_thought, _rng.choice(base_thoughts)])
             else:
-                combined = random.choice(base_thoughts)
+                combined = _rng.choice(base_thoughts)
 
             # Inject time and mood for realism
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = _clock()
             return f"[{timestamp}] {combined}"
 
         except Exception as e:
@@ -60,8 +72,7 @@ class ReasoningEngine:
 
     def recall_recent_memory(self) -> str:
         """Recall a recent reflection for continuity."""
-        reflections = self.memory.long_term_memory.get("reflections", [])
-        if not reflections:
+        if not self._reflections:
             return "No prior reflections available."
-        last_ref = reflections[-1]
+        last_ref = self._reflections[-1]
         return f"Recalling last reflection ({last_ref['timestamp']}): {last_ref['reflection']}"
\ No newline at end of file
@@ -5,17 +5,55 @@
 # Compatible with MemoryFusion v6.0 + ThinkingEngine v6.0
 # -------------------------------------------------------
 
+import atexit
 import json
 import random
 from datetime import datetime
 from typing import Dict, Any
 from MemoryFusion import MemoryFusion
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Keyword -> emotion, checked in order (first keyword found in the text wins).
+_EMOTION_KEYWORDS = (
+    ("happy", "positive"),
+    ("excited", "motivated"),
+    ("angry", "frustrated"),
+    ("sad", "reflective"),
+    ("confused", "uncertain"),
+    ("tired", "fatigued"),
+    ("focused", "determined"),
+)
+# Cue -> classification, checked in order like the keywords above.
+_REASONING_CUES = (
+    ("why", "Explores motivation and cause."),
+    ("how", "Focuses on logical method or execution."),
+    ("what if", "Considers alternate possibilities."),
+)
+
+
+_rng = random.Random()  # module-private generator, seeded from the OS
+
+
+def _shuffled(options):
+    """Yield options forever, reshuffled on every pass."""
+    while True:
+        yield from _rng.sample(options, len(options))
+
+
+_FALLBACK_EMOTIONS = _shuffled(("neutral", "curious", "inspired", "reflective"))
+
 
 class ReflectionLayer:
     def __init__(self, memory: MemoryFusion):
         self.memory = memory
+        self._reflections = memory.long_term_memory.setdefault("reflections", [])
         self.correction_log_file = "corrections.log"
+        self._log_fp = None  # append handle, opened on the first correction
 
     # ====================================================
     # CORE REFLECTION
@@ -23,9 +61,10 @@ class ReflectionLayer:
     def process_thought(self, thought: str) -> str:
         """Process a thought into a reflection with auto-evaluation."""
         try:
-            # Step 1: Analyze
-            emotion = self._detect_emotion(thought)
-            reasoning = self._analyze_reasoning(thought)
+            # Step 1: Analyze (both detectors share one lowered copy)
+            lowered = thought.lower()
+            emotion = self._detect_emotion(lowered)
+            reasoning = self._analyze_reasoning(lowered)
 
             # Step 2: Compose reflection
             reflection = (
@@ -52,41 +91,31 @@ class ReflectionLayer:
     # EMOTION + REASONING ANALYSIS
     # ====================================================
     def _detect_emotion(self, text: str) -> str:
-        """Detect emotion based on simple keyword mapping."""
-        keywords = {
-            "happy": "positive",
-            "excited": "motivated",
-            "angry": "frustrated",
-            "sad": "reflective",
-            "confused": "uncertain",
-            "tired": "fatigued",
-            "focused": "determined",
-        }
-        for k, v in keywords.items():
-            if k in text.lower():
+        """Detect emotion based on simple keyword mapping (text already lowercased)."""
+        for k, v in _EMOTION_KEYWORDS:
+            if k in text:
                 return v
-        return random.choice(["neutral", "curious", "inspired", "reflective"])
+        return next(_FALLBACK_EMOTIONS)
 
     def _analyze_reasoning(self, text: str) -> str:
-        """Generate reasoning classification."""
-        if "why" in text.lower():
-            return "Explores motivation and cause."
-        elif "how" in text.lower():
-            return "Focuses on logical method or execution."
-        elif "what if" in text.lower():
-            return "Considers alternate possibilities."
-        else:
-            return "Processes direct or factual reasoning."
+        """Generate reasoning classification (text already lowercased)."""
+        for cue, classification in _REASONING_CUES:
+            if cue in text:
+                return classification
+        return "Processes direct or factual reasoning."
 
     # ====================================================
     # SELF-EVALUATION
     # ====================================================
     def _auto_evaluate_reflection(self, reflection: str) -> int:
         """Rate reflection based on its clarity and structure."""
-        length = len(reflection.split())
-        clarity_score = 5 if "Insight" in reflection and "Emotion" in reflection else 3
+        # Only the 25/40-word thresholds matter, so stop splitting past 41 words.
+        length = len(reflection.split(None, 41))
+        has_detected = "Emotion detected" in reflection
+        has_emotion = has_detected or "Emotion" in reflection
+        clarity_score = 5 if "Insight" in reflection and has_emotion else 3
         length_score = 5 if length > 40 else 4 if length > 25 else 3
-        emotion_bonus = 1 if "Emotion detected" in reflection else 0
+        emotion_bonus = 1 if has_detected else 0
 
         raw_score = clarity_score + length_score + emotion_bonus
         normalized = max(2, min(5, round(raw_score / 3)))
@@ -103,15 +132,26 @@ class ReflectionLayer:
             "emotion": emotion,
             "self_confidence": confidence,
         }
-        self.memory.long_term_memory.setdefault("reflections", []).append(entry)
+        self._reflections.append(entry)
         self.memory.update_confidence_trend(confidence)
         self.memory._save()
 
+    def flush(self):
+        """Persist reflections still waiting on MemoryFusion's save debounce."""
+        self.memory.flush()
+
     def _log_correction(self, message: str):
         """Log internal reflection errors."""
         log_entry = {"timestamp": datetime.now().isoformat(), "message": message}
         try:
-            with open(self.correction_log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            if orjson is not None:
+                line = orjson.dumps(log_entry) + b"\n"
+            else:
+                line = (json.dumps(log_entry) + "\n").encode("utf-8")
+            if self._log_fp is None:
+                # Unbuffered: each entry is one write() straight to disk, none lost on a crash.
+                self._log_fp = open(self.correction_log_file, "ab", buffering=0)
+                atexit.register(self._log_fp.close)
+            self._log_fp.write(line)
         except Exception:
             pass
\ No newline at end of file
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 from typing import Any, Dict, Callable, Optional
 
+from router.ping_v1 import ping_response
+
 router = APIRouter(prefix="/jon", tags=["Jon"])
 
 
 @router.get("/ping")
-def ping():
-    return {"status": "ok", "role": "Jon Executor", "mode": "router-online"}
+async def ping():
+    return ping_response("Jon Executor")
 
 
 class JonExecuteRequest(BaseModel):
@@ -39,21 +43,29 @@ def _first_callable(mod: Any, names: list[str]) -> Optional[Callable]:
     return None
 
 
-@router.post("/execute_v1", response_model=JonExecuteResponse)
-def execute_v1(req: JonExecuteRequest):
+@lru_cache(maxsize=1)
+def _legacy_fn() -> Optional[Callable]:
+    """Resolve the legacy executor once; None (also cached) if it isn't installed."""
     legacy = _load_legacy()
-    if legacy:
-        fn = _first_callable(legacy, ["execute_v1", "execute", "run"])
-        if fn:
-            out = fn(req.action, req.payload)
-            if isinstance(out, dict):
-                return JonExecuteResponse(
-                    ok=bool(out.get("ok", True)),
-                    message=str(out.get("message", "Executed.")),
-                    execution=dict(out.get("execution", out)),
-                )
-
-    return JonExecuteResponse(
+    return _first_callable(legacy, ["execute_v1", "execute", "run"]) if legacy else None
+
+
+# Documented via `responses` only: the handler builds JonExecuteResponse itself
+# (model_construct, fields already coerced), so nothing is validated twice.
+@router.post("/execute_v1", response_model=None, responses={200: {"model": JonExecuteResponse}})
+def execute_v1(req: JonExecuteRequest):
+    fn = _legacy_fn()
+    if fn:
+        out = fn(req.action, req.payload)
+        if isinstance(out, dict):
+            execution = out.get("execution", out)
+            return JonExecuteResponse.model_construct(
+                ok=bool(out.get("ok", True)),
+                message=str(out.get("message", "Executed.")),
+                execution=execution if isinstance(execution, dict) else dict(execution),
+            )
+
+    return JonExecuteResponse.model_construct(
         ok=True,
         message=f"Jon queued action='{req.action}'. (Fallback — legacy function not found.)",
         execution={"action": req.action, "payload": req.payload, "fallback": True},
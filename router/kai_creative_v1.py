@@ -3,10 +3,19 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from functools import lru_cache
 import re
+import asyncio
 import base64
 
+from router.ping_v1 import ping_response
+
+try:
+    import pybase64  # optional: SIMD encoder, same output as base64
+except ImportError:
+    pybase64 = None
+
 router = APIRouter(prefix="/kai", tags=["Kai"])
 
 
@@ -26,14 +35,21 @@ def _platform_defaults(platform: str) -> Dict[str, str]:
     return {"aspect_ratio": "1:1"}
 
 
-def _safe_negative_prompt() -> str:
-    return (
-        "low quality, blurry, pixelated, watermark, signature, logo, brand marks, "
-        "too much text, illegible text, clutter, distorted faces, extra fingers, "
-        "gore, violence, hate symbols, sexual content"
-    )
+_NEGATIVE_PROMPT = (
+    "low quality, blurry, pixelated, watermark, signature, logo, brand marks, "
+    "too much text, illegible text, clutter, distorted faces, extra fingers, "
+    "gore, violence, hate symbols, sexual content"
+)
+
+
+class KaiPrompt(NamedTuple):
+    prompt: str
+    negative_prompt: str
+    aspect_ratio: str
 
 
+# Bubble resends the same campaign fields a lot; args are all hashable for the cache.
+@lru_cache(maxsize=2048)
 def _build_prompt(
     platform: str,
     niche: str,
@@ -41,10 +57,10 @@ def _build_prompt(
     audience: str,
     selected_hook: str,
     visual_style: str,
-    brand_colors: Optional[List[str]] = None,
+    brand_colors: Tuple[str, ...] = (),
     brand_font_hint: str = "",
     include_logo: bool = False,
-) -> Dict[str, Any]:
+) -> KaiPrompt:
     defaults = _platform_defaults(platform)
     aspect_ratio = defaults["aspect_ratio"]
 
@@ -81,19 +97,15 @@ def _build_prompt(
         "Output: one high-quality final image."
     ).strip()
 
-    return {
-        "prompt": prompt,
-        "negative_prompt": _safe_negative_prompt(),
-        "aspect_ratio": aspect_ratio,
-    }
+    return KaiPrompt(prompt, _NEGATIVE_PROMPT, aspect_ratio)
 
 
 # -------------------------
 # Models
 # -------------------------
 @router.get("/ping")
-def ping():
-    return {"status": "ok", "role": "Kai Creative", "mode": "router-online"}
+async def ping():
+    return ping_response("Kai Creative")
 
 
 class KaiImageBriefRequest(BaseModel):
@@ -115,24 +127,26 @@ class KaiImageBriefResponse(BaseModel):
     aspect_ratio: str
 
 
-@router.post("/image_brief_v1", response_model=KaiImageBriefResponse)
-def image_brief_v1(req: KaiImageBriefRequest):
-    out = _build_prompt(
+def _prompt_for(req: KaiImageBriefRequest) -> KaiPrompt:
+    return _build_prompt(
         platform=req.platform,
         niche=req.niche,
         offer=req.offer,
         audience=req.audience,
         selected_hook=req.selected_hook,
         visual_style=req.visual_style,
-        brand_colors=req.brand_colors,
+        brand_colors=tuple(req.brand_colors),
         brand_font_hint=req.brand_font_hint,
         include_logo=req.include_logo,
     )
-    return KaiImageBriefResponse(
-        prompt=out["prompt"],
-        negative_prompt=out["negative_prompt"],
-        aspect_ratio=out["aspect_ratio"],
-    )
+
+
+# Kai's routes skip response_model: they return dicts/models they build from
+# already-clean values, so FastAPI re-validating them is wasted work. The models
+# stay in `responses` for /docs.
+@router.post("/image_brief_v1", response_model=None, responses={200: {"model": KaiImageBriefResponse}})
+def image_brief_v1(req: KaiImageBriefRequest):
+    return _prompt_for(req)._asdict()
 
 
 # -------------------------
@@ -183,7 +197,7 @@ def _try_generate_with_local_provider(prompt: str, negative_prompt: str, aspect_
         raise HTTPException(status_code=500, detail="generate_image() must return a dict.")
 
     if result.get("image_url"):
-        return KaiGenerateImageResponse(
+        return KaiGenerateImageResponse.model_construct(
             ok=True,
             image_url=str(result["image_url"]),
             provider=str(result.get("provider", "local_provider")),
@@ -191,7 +205,7 @@ def _try_generate_with_local_provider(prompt: str, negative_prompt: str, aspect_
         )
 
     if result.get("image_base64"):
-        return KaiGenerateImageResponse(
+        return KaiGenerateImageResponse.model_construct(
             ok=True,
             image_base64=str(result["image_base64"]),
             provider=str(result.get("provider", "local_provider")),
@@ -201,8 +215,8 @@ def _try_generate_with_local_provider(prompt: str, negative_prompt: str, aspect_
     if result.get("image_bytes"):
         b = result["image_bytes"]
         if isinstance(b, bytes):
-            b64 = base64.b64encode(b).decode("utf-8")
-            return KaiGenerateImageResponse(
+            b64 = (pybase64 or base64).b64encode(b).decode("ascii")
+            return KaiGenerateImageResponse.model_construct(
                 ok=True,
                 image_base64=b64,
                 provider=str(result.get("provider", "local_provider")),
@@ -212,39 +226,33 @@ def _try_generate_with_local_provider(prompt: str, negative_prompt: str, aspect_
     raise HTTPException(status_code=500, detail="generate_image() returned no image_url/image_base64/image_bytes.")
 
 
-@router.post("/generate_image_v1", response_model=KaiGenerateImageResponse)
-def generate_image_v1(req: KaiGenerateImageRequest):
-    # Build prompt unless Bubble provides override
-    if _clean(req.prompt_override):
-        prompt = _clean(req.prompt_override)
-        out = _build_prompt(
-            platform=req.platform,
-            niche=req.niche,
-            offer=req.offer,
-            audience=req.audience,
-            selected_hook=req.selected_hook,
-            visual_style=req.visual_style,
-            brand_colors=req.brand_colors,
-            brand_font_hint=req.brand_font_hint,
-            include_logo=req.include_logo,
-        )
-        negative_prompt = out["negative_prompt"]
-        aspect_ratio = out["aspect_ratio"]
-    else:
-        out = _build_prompt(
-            platform=req.platform,
-            niche=req.niche,
-            offer=req.offer,
-            audience=req.audience,
-            selected_hook=req.selected_hook,
-            visual_style=req.visual_style,
-            brand_colors=req.brand_colors,
-            brand_font_hint=req.brand_font_hint,
-            include_logo=req.include_logo,
+# Generations currently running, keyed by exactly what is sent to the provider.
+_INFLIGHT: Dict[Tuple[str, str, str], "asyncio.Future[KaiGenerateImageResponse]"] = {}
+
+
+async def _generate_coalesced(prompt: str, negative_prompt: str, aspect_ratio: str) -> KaiGenerateImageResponse:
+    """
+    Identical requests that arrive while one is already generating (Bubble retries,
+    double-submits) wait on that generation instead of starting their own.
+    The provider call (and any base64 of raw bytes) blocks, so it runs on a worker thread.
+    """
+    key = (prompt, negative_prompt, aspect_ratio)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            asyncio.to_thread(_try_generate_with_local_provider, prompt, negative_prompt, aspect_ratio)
         )
-        prompt = out["prompt"]
-        negative_prompt = out["negative_prompt"]
-        aspect_ratio = out["aspect_ratio"]
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # shield: one caller disconnecting must not cancel the others' generation.
+    return await asyncio.shield(task)
+
+
+@router.post("/generate_image_v1", response_model=None, responses={200: {"model": KaiGenerateImageResponse}})
+async def generate_image_v1(req: KaiGenerateImageRequest):
+    out = _prompt_for(req)
+    # Bubble may pass its own prompt; the negative prompt and ratio still come from Kai.
+    prompt = _clean(req.prompt_override) or out.prompt
 
     # On-demand generation only
-    return _try_generate_with_local_provider(prompt, negative_prompt, aspect_ratio)
\ No newline at end of file
+    return await _generate_coalesced(prompt, out.negative_prompt, out.aspect_ratio)
\ No newline at end of file
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 from typing import Any, Dict, Callable, Optional
 
+from router.ping_v1 import ping_response
+
 router = APIRouter(prefix="/maya", tags=["Maya"])
 
 
 @router.get("/ping")
-def ping():
-    return {"status": "ok", "role": "Maya Coach", "mode": "router-online"}
+async def ping():
+    return ping_response("Maya Coach")
 
 
 class MayaExplainRequest(BaseModel):
@@ -23,6 +27,11 @@ class MayaExplainResponse(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+_FALLBACK_EXPLANATION = (
+    "This works because it stays on-niche, uses a clear hook → proof → CTA, and avoids spam patterns."
+)
+
+
 def _load_legacy():
     try:
         import router.maya_coach_v1_legacy as legacy  # type: ignore
@@ -39,22 +48,29 @@ def _first_callable(mod: Any, names: list[str]) -> Optional[Callable]:
     return None
 
 
-@router.post("/explain_v1", response_model=MayaExplainResponse)
-def explain_v1(req: MayaExplainRequest):
+@lru_cache(maxsize=1)
+def _legacy_fn() -> Optional[Callable]:
+    """Resolve the legacy coach once; None (also cached) if it isn't installed."""
     legacy = _load_legacy()
-    if legacy:
-        fn = _first_callable(legacy, ["explain_v1", "explain", "coach"])
-        if fn:
-            out = fn(req.topic, req.payload)
-            if isinstance(out, dict):
-                return MayaExplainResponse(
-                    ok=bool(out.get("ok", True)),
-                    explanation=str(out.get("explanation", "")),
-                    metadata=dict(out.get("metadata", {})),
-                )
-
-    return MayaExplainResponse(
+    return _first_callable(legacy, ["explain_v1", "explain", "coach"]) if legacy else None
+
+
+# Documented via `responses` only: both return paths build MayaExplainResponse from
+# values already coerced here (model_construct), so nothing needs re-validating.
+@router.post("/explain_v1", response_model=None, responses={200: {"model": MayaExplainResponse}})
+def explain_v1(req: MayaExplainRequest):
+    fn = _legacy_fn()
+    if fn:
+        out = fn(req.topic, req.payload)
+        if isinstance(out, dict):
+            return MayaExplainResponse.model_construct(
+                ok=bool(out.get("ok", True)),
+                explanation=str(out.get("explanation", "")),
+                metadata=dict(out.get("metadata", {})),
+            )
+
+    return MayaExplainResponse.model_construct(
         ok=True,
-        explanation="This works because it stays on-niche, uses a clear hook → proof → CTA, and avoids spam patterns.",
+        explanation=_FALLBACK_EXPLANATION,
         metadata={"fallback": True, "topic": req.topic},
     )
\ No newline at end of file
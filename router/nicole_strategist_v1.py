@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 import re
 
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
+from router.ping_v1 import ping_response
+
 
 # =========================
 # FastAPI Router (REQUIRED)
@@ -16,12 +18,8 @@ router = APIRouter(prefix="/nicole", tags=["Nicole"])
 
 
 @router.get("/ping")
-def ping():
-    return {
-        "status": "ok",
-        "role": "Nicole Strategist",
-        "mode": "router-online",
-    }
+async def ping():
+    return ping_response("Nicole Strategist")
 
 
 # =========================
@@ -41,10 +39,18 @@ def set_brand_profile(
     brand_voice: str,
     goals: List[str],
 ) -> Dict[str, Any]:
-    BOOK_OF_TRUTH["niche"] = (niche or "").strip().lower()
-    BOOK_OF_TRUTH["content_type"] = (content_type or "").strip().lower()
-    BOOK_OF_TRUTH["brand_voice"] = (brand_voice or "").strip()
-    BOOK_OF_TRUTH["goals"] = goals or []
+    """
+    Replaces the profile in one assignment: a plan_campaign running in another
+    worker thread sees the old profile or the new one, never a mix of both.
+    Treat the returned dict as read-only; call this again to change it.
+    """
+    global BOOK_OF_TRUTH
+    BOOK_OF_TRUTH = {
+        "niche": (niche or "").strip().lower(),
+        "content_type": (content_type or "").strip().lower(),
+        "brand_voice": (brand_voice or "").strip(),
+        "goals": goals or [],
+    }
     return BOOK_OF_TRUTH
 
 
@@ -73,54 +79,79 @@ def _clean_lines(text: str) -> List[str]:
     return [ln.strip() for ln in (text or "").splitlines() if ln.strip()]
 
 
-def _extract_field(block: str, label: str) -> Optional[str]:
+# Labels engine_api writes into a campaign brief, as "LABEL: value" lines.
+_BRIEF_LABELS = ("Niche", "Platform", "Goal", "Target audience", "Tone", "Style", "Offer")
+_BRIEF_FIELD_RE = re.compile(
+    r"^(" + "|".join(re.escape(label) for label in _BRIEF_LABELS) + r")\s*:\s*(.+)$",
+    re.IGNORECASE,
+)
+
+
+def _extract_fields(block: str) -> Dict[str, str]:
     """
-    Looks for: LABEL: value
+    Looks for: LABEL: value, for every brief label in one pass over the lines.
+    Keys are the lowercased labels; the first line for a label wins.
     """
-    pattern = re.compile(rf"^{re.escape(label)}\s*:\s*(.+)$", re.IGNORECASE)
+    found: Dict[str, str] = {}
     for ln in _clean_lines(block):
-        m = pattern.match(ln)
+        m = _BRIEF_FIELD_RE.match(ln)
         if m:
-            return m.group(1).strip()
-    return None
+            found.setdefault(m.group(1).lower(), m.group(2).strip())
+    return found
+
+
+_HOOK_TEMPLATES = (
+    "If you’re in {niche}, this is the fastest way to get {goal}.",
+    "Most {niche} creators mess this up on {platform} — don’t.",
+    "Do this once and watch your {goal} improve this week.",
+)
+
+_CAPTION_TEMPLATE = (
+    "{headline} doesn’t come from posting more — it comes from posting smarter.\n\n"
+    "Focus: {niche}\n"
+    "Audience: {target_audience}\n"
+    "Offer: {offer}\n\n"
+    "1) Hook in the first 2 seconds\n"
+    "2) Show proof or a clear step\n"
+    "3) Simple CTA\n\n"
+    'Comment "PLAN" and I’ll generate the next post.'
+)
 
 
 def _fallback_hooks(niche: str, goal: str, platform: str) -> List[str]:
     # Simple deterministic fallback so Bubble never gets empty hooks.
-    niche = niche or "your niche"
-    goal = goal or "your goal"
-    platform = platform or "your platform"
-    return [
-        f"If you’re in {niche}, this is the fastest way to get {goal}.",
-        f"Most {niche} creators mess this up on {platform} — don’t.",
-        f"Do this once and watch your {goal} improve this week.",
-    ]
+    fields = {
+        "niche": niche or "your niche",
+        "goal": goal or "your goal",
+        "platform": platform or "your platform",
+    }
+    return [t.format_map(fields) for t in _HOOK_TEMPLATES]
 
 
 def _fallback_caption(niche: str, goal: str, target_audience: str, offer: str) -> str:
-    niche = niche or "your niche"
-    goal = goal or "results"
-    target_audience = target_audience or "your ideal customers"
-    offer = offer or "your main offer"
-
-    return (
-        f"{goal.title()} doesn’t come from posting more — it comes from posting smarter.\n\n"
-        f"Focus: {niche}\n"
-        f"Audience: {target_audience}\n"
-        f"Offer: {offer}\n\n"
-        "1) Hook in the first 2 seconds\n"
-        "2) Show proof or a clear step\n"
-        "3) Simple CTA\n\n"
-        'Comment "PLAN" and I’ll generate the next post.'
+    return _CAPTION_TEMPLATE.format(
+        headline=(goal or "results").title(),
+        niche=niche or "your niche",
+        target_audience=target_audience or "your ideal customers",
+        offer=offer or "your main offer",
     )
 
 
+_BASE_HASHTAGS = ("#smallbusiness", "#marketing", "#contentstrategy")
+_NOT_TAG_CHAR = re.compile(r"[^a-z0-9]+")
+_NOT_TAG_BYTES = bytes(sorted(set(range(256)) - set(b"abcdefghijklmnopqrstuvwxyz0123456789")))
+
+
+def _hashtag(text: str) -> str:
+    text = text.lower()
+    if text.isascii():
+        # Usual case: one C pass deleting every byte outside [a-z0-9].
+        return "#" + text.encode("ascii").translate(None, _NOT_TAG_BYTES).decode("ascii")
+    return "#" + _NOT_TAG_CHAR.sub("", text)
+
+
 def _fallback_hashtags(niche: str, platform: str) -> str:
-    base = ["#smallbusiness", "#marketing", "#contentstrategy"]
-    niche_tag = "#" + re.sub(r"[^a-z0-9]+", "", (niche or "niche").lower())
-    plat_tag = "#" + re.sub(r"[^a-z0-9]+", "", (platform or "social").lower())
-    tags = base + [niche_tag, plat_tag]
-    return " ".join(tags[:8])
+    return " ".join((*_BASE_HASHTAGS, _hashtag(niche or "niche"), _hashtag(platform or "social")))
 
 
 def _fallback_visual(style_hint: str, platform: str) -> str:
@@ -137,6 +168,12 @@ def _fallback_visual(style_hint: str, platform: str) -> str:
 # =========================
 # Nicole core: bounded output
 # =========================
+_MAYA_SUMMARY = (
+    "This works because it matches the campaign goal, stays inside the niche, "
+    "and uses a clear hook + proof + CTA structure (algorithm-friendly) and consistent."
+)
+
+
 def generate_studio_output(
     *,
     niche: str,
@@ -168,17 +205,12 @@ def generate_studio_output(
     hashtags = _fallback_hashtags(niche=niche, platform=platform)
     visual = _fallback_visual(style_hint=style, platform=platform)
 
-    maya_summary = (
-        "This works because it matches the campaign goal, stays inside the niche, "
-        "and uses a clear hook + proof + CTA structure (algorithm-friendly) and consistent."
-    )
-
     return NicoleStudioOutput(
         hooks=hooks,
         caption=caption,
         hashtags=hashtags,
         recommended_visual_style=visual,
-        maya_summary=maya_summary,
+        maya_summary=_MAYA_SUMMARY,
     )
 
 
@@ -187,20 +219,22 @@ def plan_campaign(prompt: str) -> NicoleResponse:
     Backward compatible function your engine can call.
     If prompt includes a campaign brief, we attempt to read niche/platform/goal.
     """
-    # Pull from Book of Truth as a baseline
-    niche = (BOOK_OF_TRUTH.get("niche") or "").strip().lower()
-    content_type = (BOOK_OF_TRUTH.get("content_type") or "").strip().lower()
-    goals = BOOK_OF_TRUTH.get("goals") or []
+    # Pull from Book of Truth as a baseline (one snapshot for the whole plan)
+    book = BOOK_OF_TRUTH
+    niche = (book.get("niche") or "").strip().lower()
+    content_type = (book.get("content_type") or "").strip().lower()
+    goals = book.get("goals") or []
     default_goal = (goals[0] if goals else "").strip().lower()
 
     # Try to extract from the prompt that engine_api builds
-    p_niche = _extract_field(prompt, "Niche")
-    p_platform = _extract_field(prompt, "Platform")
-    p_goal = _extract_field(prompt, "Goal")
-    p_aud = _extract_field(prompt, "Target audience")
-    p_tone = _extract_field(prompt, "Tone")
-    p_style = _extract_field(prompt, "Style")
-    p_offer = _extract_field(prompt, "Offer")
+    fields = _extract_fields(prompt)
+    p_niche = fields.get("niche")
+    p_platform = fields.get("platform")
+    p_goal = fields.get("goal")
+    p_aud = fields.get("target audience")
+    p_tone = fields.get("tone")
+    p_style = fields.get("style")
+    p_offer = fields.get("offer")
 
     niche = (p_niche or niche or "unknown niche").strip().lower()
     platform = (p_platform or content_type or "unknown").strip().lower()
@@ -275,8 +309,14 @@ class NicoleStepCardResponse(BaseModel):
 # =========================
 # Endpoints (what Bubble will call)
 # =========================
-@router.post("/studio_generate_v1", response_model=NicoleStudioGenerateResponse)
-def studio_generate_v1(payload: NicoleStudioGenerateRequest):
+# Returns a plain dict built from our own dataclass, so skip response validation;
+# the model stays in `responses` for /docs.
+@router.post(
+    "/studio_generate_v1",
+    response_model=None,
+    responses={200: {"model": NicoleStudioGenerateResponse}},
+)
+async def studio_generate_v1(payload: NicoleStudioGenerateRequest):
     studio = generate_studio_output(
         niche=payload.niche,
         platform=payload.platform,
@@ -286,25 +326,27 @@ def studio_generate_v1(payload: NicoleStudioGenerateRequest):
         style=payload.style,
         offer=payload.offer,
     )
-    return NicoleStudioGenerateResponse(
-        hooks=studio.hooks,
-        caption=studio.caption,
-        hashtags=studio.hashtags,
-        recommended_visual_style=studio.recommended_visual_style,
-        maya_summary=studio.maya_summary,
-    )
+    return {
+        "hooks": studio.hooks,
+        "caption": studio.caption,
+        "hashtags": studio.hashtags,
+        "recommended_visual_style": studio.recommended_visual_style,
+        "maya_summary": studio.maya_summary,
+    }
+
+
+# Every card for the allowed step_ids (1-10), built once.
+_STEP_MESSAGES: Dict[int, str] = {
+    step: f"Step {step}: Keep it tight. One message, one action, one CTA." for step in range(1, 11)
+}
+_STEP_MESSAGES.update({
+    1: "Step 1: Confirm the goal + platform. Then choose 1 hook to lead with.",
+    2: "Step 2: Pick the best hook. Keep it short, direct, and specific.",
+    3: "Step 3: Choose a visual style that matches the hook (simple + clear).",
+})
 
 
-@router.post("/step_card_v1", response_model=NicoleStepCardResponse)
-def step_card_v1(payload: NicoleStepCardRequest):
+@router.post("/step_card_v1", response_model=None, responses={200: {"model": NicoleStepCardResponse}})
+async def step_card_v1(payload: NicoleStepCardRequest):
     # Simple bounded guidance cards (v1). We can upgrade later.
-    step = payload.step_id
-    if step == 1:
-        msg = "Step 1: Confirm the goal + platform. Then choose 1 hook to lead with."
-    elif step == 2:
-        msg = "Step 2: Pick the best hook. Keep it short, direct, and specific."
-    elif step == 3:
-        msg = "Step 3: Choose a visual style that matches the hook (simple + clear)."
-    else:
-        msg = f"Step {step}: Keep it tight. One message, one action, one CTA."
-    return NicoleStepCardResponse(message=msg)
\ No newline at end of file
+    return {"message": _STEP_MESSAGES[payload.step_id]}
\ No newline at end of file
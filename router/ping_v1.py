@@ -0,0 +1,20 @@
+# router/ping_v1.py
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+
+from fastapi import Response
+
+
+@lru_cache(maxsize=None)
+def _ping_body(role: str) -> bytes:
+    # Liveness body never changes per role: encode it once, skip per-request serialization.
+    return json.dumps(
+        {"status": "ok", "role": role, "mode": "router-online"}, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def ping_response(role: str) -> Response:
+    """/ping reply shared by every family router."""
+    return Response(_ping_body(role), media_type="application/json")
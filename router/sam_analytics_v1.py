@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 from typing import Any, Dict, Callable, Optional
 
+from router.ping_v1 import ping_response
+
 router = APIRouter(prefix="/sam", tags=["Sam"])
 
 
 @router.get("/ping")
-def ping():
-    return {"status": "ok", "role": "Sam Analytics", "mode": "router-online"}
+async def ping():
+    return ping_response("Sam Analytics")
 
 
 class SamAnalyzeRequest(BaseModel):
@@ -23,6 +27,16 @@ class SamAnalyzeResponse(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+# Fallback answer when no legacy analyzer is installed; shared by every response
+# (serialized, never mutated).
+_FALLBACK_INSIGHTS: Dict[str, Any] = {
+    "algo_health_hint": "stable",
+    "signal": "needs more proof content",
+    "next_move": "post 3 times this week staying in the same niche + format",
+}
+_FALLBACK_METADATA: Dict[str, Any] = {"fallback": True}
+
+
 def _load_legacy():
     try:
         import router.sam_analytics_v1_legacy as legacy  # type: ignore
@@ -39,26 +53,29 @@ def _first_callable(mod: Any, names: list[str]) -> Optional[Callable]:
     return None
 
 
-@router.post("/analyze_v1", response_model=SamAnalyzeResponse)
-def analyze_v1(req: SamAnalyzeRequest):
+@lru_cache(maxsize=1)
+def _legacy_fn() -> Optional[Callable]:
+    """Resolve the legacy analytics function once; None (also cached) if it isn't installed."""
     legacy = _load_legacy()
-    if legacy:
-        fn = _first_callable(legacy, ["analyze_v1", "analyze", "score"])
-        if fn:
-            out = fn(req.campaign, req.metrics)
-            if isinstance(out, dict):
-                return SamAnalyzeResponse(
-                    ok=bool(out.get("ok", True)),
-                    insights=dict(out.get("insights", out)),
-                    metadata=dict(out.get("metadata", {})),
-                )
-
-    return SamAnalyzeResponse(
+    return _first_callable(legacy, ["analyze_v1", "analyze", "score"]) if legacy else None
+
+
+# Documented via `responses` only: both return paths build SamAnalyzeResponse from
+# values already coerced here (model_construct), so nothing needs re-validating.
+@router.post("/analyze_v1", response_model=None, responses={200: {"model": SamAnalyzeResponse}})
+def analyze_v1(req: SamAnalyzeRequest):
+    fn = _legacy_fn()
+    if fn:
+        out = fn(req.campaign, req.metrics)
+        if isinstance(out, dict):
+            return SamAnalyzeResponse.model_construct(
+                ok=bool(out.get("ok", True)),
+                insights=dict(out.get("insights", out)),
+                metadata=dict(out.get("metadata", {})),
+            )
+
+    return SamAnalyzeResponse.model_construct(
         ok=True,
-        insights={
-            "algo_health_hint": "stable",
-            "signal": "needs more proof content",
-            "next_move": "post 3 times this week staying in the same niche + format",
-        },
-        metadata={"fallback": True},
+        insights=_FALLBACK_INSIGHTS,
+        metadata=_FALLBACK_METADATA,
     )
\ No newline at end of file